@@ -6,44 +6,129 @@ This application is called Wordle. It takes user input of a word, checks it agai
 
 import random
 
-from WordleDictionary import FIVE_LETTER_WORDS
-from WordleGraphics import WordleGWindow, N_COLS, N_ROWS, MISSING_COLOR, UNKNOWN_COLOR
+from WordleDifficulty import DifficultyPicker, load_index
+from WordleEngine import CandidateTracker, GameEngine
+from WordleGraphics import WordleGWindow, N_ROWS
+from WordleRegistry import DEFAULT_DICTIONARY, get_dictionary
+from WordleReplay import ReplayWriter, default_log_path
+from WordleSchedule import AnswerScheduler, puzzle_number
+from WordleSolver import Solver
+from WordleStats import GameStats, default_stats_path
 
-def wordle():
+def wordle(dictionary=DEFAULT_DICTIONARY, difficulty=None, seed=0, puzzle=None,
+           data_dir=None):
     def enter_action(s):
         # s is the word that the user typed in
-        if s.lower() in FIVE_LETTER_WORDS:
-            row = gw.get_current_row()
-            matched_indices = set()
-            correct_indices = set()
-
-            CORRECT_COLOR, PRESENT_COLOR = gw.apply_mode()
-
-            for i in range(len(s)):
-                if s[i] == random_word[i] and i not in correct_indices:
-                    gw.set_square_color(row, i, CORRECT_COLOR)
-                    correct_indices.add(i)
-                elif s[i] in random_word and i not in matched_indices:
-                    gw.set_square_color(row, i, PRESENT_COLOR)
-                    matched_indices.add(i)
-                elif i not in correct_indices and i not in matched_indices:
-                    gw.set_square_color(row, i, MISSING_COLOR)
-
-            if s == random_word:
-                gw.show_stats()
+        if engine.is_over():
+            return False
+        if engine.row == 0:
+            engine.set_hard_mode(gw.is_hard_mode())
+        problem = engine.check(s)
+        if problem is not None:
+            gw.show_message(problem)
+            return False
+        code = engine.submit(s)
+        gw.show_feedback(gw.get_current_row(), code)
+        gw.update_keys(engine.key_changes)
+        tracker.update(s, code)
+        show_candidates()
+        if engine.is_over():
+            record_game()
+
+        # the window shows the stats itself after the last row
+        if engine.is_won() and engine.row < N_ROWS:
+            gw.show_stats()
+
+    def typing_action(col, ch):
+        # each letter typed or deleted moves the prefix by one step
+        if ch == " ":
+            tracker.pop()
+        else:
+            tracker.push(ch)
+        show_candidates()
+
+    def show_candidates():
+        msg = f"{tracker.count()} possible answers"
+        if tracker.prefix:
+            msg += f", {tracker.prefix_count()} starting with {tracker.prefix.upper()}"
+        gw.show_status(msg)
+
+    def find_hint(history, hard_mode):
+        # runs in the window's worker thread, the only user of these solvers
+        solver = solvers.get(hard_mode)
+        if solver is None:
+            solver = Solver(words.allowed, answers=words.answer_ids,
+                            hard_mode=hard_mode)
+            solvers[hard_mode] = solver
+        solver.reset()
+        for guess, code in history:
+            solver.update(guess, code)
+        return solver.best_word()
+
+    def show_hint(word):
+        if word is None:
+            gw.show_message("No words match the clues!")
         else:
-            gw.show_message("Not a valid word. Try again!")
+            gw.show_message(f"Try {word.upper()}")
+
+    def hint_action():
+        # the hint is worked out in the background and dropped if the
+        # player types or moves on before it is ready
+        if engine.is_over():
+            return
+        if engine.row == 0:
+            engine.set_hard_mode(gw.is_hard_mode())
+        gw.cancel_background()
+        gw.show_message("Thinking...")
+        history = list(zip(engine.guesses, engine.feedback))
+        gw.run_in_background(find_hint, history, engine.hard_mode,
+                             callback=show_hint)
+
+    def record_game():
+        # finished games go to the replay log and the statistics
+        lexicon = words.allowed
+        with ReplayWriter(default_log_path(lexicon, data_dir), lexicon, N_ROWS) as log:
+            log.append(answer, [ lexicon.index(g) for g in engine.guesses ],
+                       engine.feedback)
+        stats.record(answer, engine.row if engine.is_won() else 0)
+        stats.save()
 
-    #choose random word
-    random_word = random.choice(FIVE_LETTER_WORDS).upper()
+    solvers = { }
+
+    #choose the answer for a numbered puzzle, by default today's; the same
+    #dictionary, seed and puzzle number always give the same answer
+    words = get_dictionary(dictionary)
+    if puzzle is None:
+        puzzle = puzzle_number()
+    answer = None
+    if difficulty is not None:
+        index = load_index(words.allowed, answers=words.answer_ids)
+        if index is not None:
+            rng = random.Random(f"{dictionary}:{seed}:{puzzle}")
+            answer = DifficultyPicker(index, words.answer_ids).pick(difficulty, rng)
+    if answer is None:
+        answer = AnswerScheduler(words.answer_ids, seed, dictionary).answer(puzzle)
+    random_word = words.allowed.word(answer).upper()
     print(random_word)
+    engine = GameEngine(random_word, lexicon=words.allowed, n_rows=N_ROWS)
+    tracker = CandidateTracker(words.allowed, words.answer_ids)
     
-    gw = WordleGWindow()
+    #finished games are kept in data_dir, by default the user's data directory
+    stats = GameStats(words.allowed, N_ROWS,
+                      default_stats_path(words.allowed, data_dir))
+
+    gw = WordleGWindow(lexicon=words.allowed)
+    gw.set_stats(stats)
 
     gw.add_enter_listener(enter_action)
+    gw.add_hint_listener(hint_action)
+    gw.add_typing_listener(typing_action)
 
     gw.show_message("Enter a word")
     gw.set_current_row(0)
+    show_candidates()
+    # the caller starts the window with gw.run() or gw.run_async()
+    return gw
 
 if __name__ == "__main__":
-    wordle()
+    wordle().run()
@@ -0,0 +1,166 @@
+# File: WordleBench.py
+
+"""
+This program measures the throughput of the Wordle solver by playing
+it against every answer in the dictionary.  Games are split into
+chunks and played in a pool of worker processes, all of which
+memory-map the same cached feedback matrix.
+
+Usage: python -m WordleBench [--workers N] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import WordleLexicon
+from WordleEngine import DEFAULT_ROWS, solved_code
+from WordleFeedback import get_matrix, load_matrix
+from WordleLexicon import shared_lexicon
+from WordleSolver import ENTROPY, STRATEGIES, Solver
+
+# Constants
+
+DEFAULT_CHUNK = 64              # Answers handed to a worker at a time
+PERCENTILES = (50, 90, 99, 99.9)
+
+_lexicon = None                 # The lexicon owned by a worker process
+_solver = None                  # The solver owned by a worker process
+
+def _init_worker(words, digest, strategy, candidates):
+    """Loads the shared feedback matrix and creates this worker's solver."""
+    global _lexicon, _solver
+    _lexicon = shared_lexicon(words, digest)
+    _solver = Solver(_lexicon, load_matrix(_lexicon), strategy,
+                     answers=candidates)
+
+def _play_chunk(answers, max_rows):
+    """
+    Plays one game per answer id and returns a pair of lists: the
+    number of guesses used in each game (0 for a loss) and the time in
+    seconds taken by every best_guess call.
+    """
+    solved = solved_code(_lexicon.length)
+    matrix = load_matrix(_lexicon)
+    results = [ ]
+    latencies = [ ]
+    for answer in answers:
+        _solver.reset()
+        n_guesses = 0
+        for row in range(max_rows):
+            start = time.perf_counter()
+            guess = _solver.best_guess()
+            latencies.append(time.perf_counter() - start)
+            code = int(matrix[guess, answer])
+            if code == solved:
+                n_guesses = row + 1
+                break
+            _solver.update(guess, code)
+        results.append(n_guesses)
+    return results, latencies
+
+def play_games(lexicon, answers, strategy=ENTROPY, workers=None,
+               chunk_size=DEFAULT_CHUNK, max_rows=DEFAULT_ROWS, candidates=None):
+    """
+    Plays the solver against each answer id in a pool of worker
+    processes and returns a pair of lists: the number of guesses used
+    in each game (0 for a loss), in the order of answers, and the time
+    in seconds taken by every best_guess call.  If candidates is given,
+    the solver considers only those word ids as possible answers.
+    """
+    get_matrix(lexicon)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    answers = [ int(k) for k in answers ]
+    chunks = [ answers[i:i + chunk_size]
+               for i in range(0, len(answers), chunk_size) ]
+    counts = [ ]
+    latencies = [ ]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(lexicon.words, lexicon.content_hash,
+                                       strategy, candidates)) as pool:
+        futures = [ pool.submit(_play_chunk, chunk, max_rows)
+                    for chunk in chunks ]
+        for future in futures:
+            chunk_counts, chunk_latencies = future.result()
+            counts.extend(chunk_counts)
+            latencies.extend(chunk_latencies)
+    return counts, latencies
+
+def run_benchmark(answers=None, workers=None, chunk_size=DEFAULT_CHUNK,
+                  strategy=ENTROPY, max_rows=DEFAULT_ROWS):
+    """Plays the solver against the answer ids and returns a result dict."""
+    lexicon = WordleLexicon.LEXICON
+    get_matrix(lexicon)
+    if answers is None:
+        answers = list(range(len(lexicon)))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    start = time.perf_counter()
+    counts, latencies = play_games(lexicon, answers, strategy, workers,
+                                   chunk_size, max_rows)
+    wall = time.perf_counter() - start
+    counts = np.array(counts)
+    latencies = np.array(latencies) * 1000.0
+    distribution = np.bincount(counts, minlength=max_rows + 1)
+    wins = counts[counts > 0]
+    return {
+        "strategy": strategy,
+        "lexicon": lexicon.content_hash,
+        "games": len(counts),
+        "workers": workers,
+        "chunk_size": chunk_size,
+        "wall_seconds": wall,
+        "games_per_second": len(counts) / wall,
+        "win_rate": len(wins) / len(counts),
+        "mean_guesses": float(wins.mean()) if len(wins) > 0 else None,
+        "latency_ms": {
+            f"p{p:g}": float(np.percentile(latencies, p)) for p in PERCENTILES
+        },
+        "guess_distribution": {
+            str(n): int(distribution[n]) for n in range(1, max_rows + 1)
+        },
+        "losses": int(distribution[0]),
+    }
+
+def print_results(results):
+    print(f"{results['games']} games in {results['wall_seconds']:.2f} s "
+          f"({results['games_per_second']:.1f} games/s, "
+          f"{results['workers']} workers)")
+    print(f"Win rate {100 * results['win_rate']:.2f}%")
+    if results["mean_guesses"] is not None:
+        print(f"Mean guesses {results['mean_guesses']:.3f}")
+    latency = ", ".join(f"{k} {v:.2f} ms"
+                        for k, v in results["latency_ms"].items())
+    print(f"Per-guess latency: {latency}")
+    for n, count in results["guess_distribution"].items():
+        print(f"  {n}: {count}")
+    print(f"  X: {results['losses']}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle solver")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK)
+    parser.add_argument("--strategy", choices=STRATEGIES, default=ENTROPY)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--limit", type=int, default=None,
+                        help="play only every k-th answer to get this many games")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+    answers = list(range(len(WordleLexicon.LEXICON)))
+    if args.limit is not None and args.limit < len(answers):
+        step = len(answers) / args.limit
+        answers = [ answers[int(i * step)] for i in range(args.limit) ]
+    results = run_benchmark(answers, args.workers, args.chunk_size,
+                            args.strategy, args.rows)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    print_results(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# File: WordleDifficulty.py
+
+"""
+This module rates how hard each word is as a Wordle answer and picks
+answers of a chosen difficulty.
+
+The rating comes from an offline job that plays the solver against
+every answer with each strategy.  For each answer it records the mean
+number of guesses over the strategies, the most guesses any strategy
+needed (a loss counts as one more than the number of rows), and the
+number of answers that share the word's feedback for the solver's
+opening guess.  The results form a dense array indexed by word id,
+cached as a .npy file that later processes memory-map; words that
+are not answers have a NaN mean.
+
+Answers are picked from a difficulty band with an alias table: the
+answers are ranked by difficulty, each band is a bell-shaped weighting
+centered on a point of that ranking, and the table lets a weighted
+draw be made in constant time.
+
+Running this file as a program builds the index for the default
+lexicon.
+"""
+
+import os
+import random
+import tempfile
+
+import numpy as np
+
+import WordleLexicon
+from WordleBench import DEFAULT_CHUNK, play_games
+from WordleEngine import DEFAULT_ROWS
+from WordleFeedback import get_matrix
+from WordleOpenings import cache_key
+from WordlePaths import cache_dir
+from WordleSolver import ENTROPY, STRATEGIES, Solver
+
+# Constants
+
+INDEX_VERSION = 1               # Bump when the record layout changes
+INDEX_DTYPE = np.dtype([ ("expected", "<f4"), ("worst", "u1"),
+                         ("bucket", "<u2") ])
+
+BANDS = { "easy": 0.1, "medium": 0.5, "hard": 0.9 }
+BAND_WIDTH = 0.1                # Spread of a band, as a fraction of answers
+
+_indexes = { }
+
+def _answer_ids(lexicon, answers):
+    """Returns the sorted answer ids, or None if every word is an answer."""
+    if answers is None or len(answers) == len(lexicon):
+        return None
+    return np.unique(np.asarray(answers, dtype=np.intp))
+
+def index_path(lexicon, directory=None, answers=None):
+    """
+    Returns the cache file name for the difficulty index of lexicon and
+    answer ids.
+    """
+    if directory is None:
+        directory = cache_dir()
+    name = f"difficulty-v{INDEX_VERSION}-{cache_key(lexicon, answers)}.npy"
+    return os.path.join(directory, name)
+
+def build_index(lexicon=None, answers=None, strategies=STRATEGIES, workers=None,
+                chunk_size=DEFAULT_CHUNK, max_rows=DEFAULT_ROWS, path=None):
+    """
+    Plays the solver against every answer id in answers (by default,
+    every word in lexicon) with each strategy, saves the difficulty
+    index to path (by default, the cache) and returns it as a read-only
+    memory map.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    answers = _answer_ids(lexicon, answers)
+    played = np.arange(len(lexicon)) if answers is None else answers
+    results = np.empty((len(strategies), len(played)), dtype=np.int32)
+    for row, strategy in enumerate(strategies):
+        counts, _ = play_games(lexicon, played, strategy, workers, chunk_size,
+                               max_rows, answers)
+        results[row] = counts
+    results[results == 0] = max_rows + 1
+    matrix = get_matrix(lexicon)
+    opener = Solver(lexicon, matrix, ENTROPY, answers=answers).best_guess()
+    codes = np.asarray(matrix[opener][played], dtype=np.intp)
+    index = np.zeros(len(lexicon), dtype=INDEX_DTYPE)
+    index["expected"] = np.nan
+    index["expected"][played] = results.mean(axis=0)
+    index["worst"][played] = results.max(axis=0)
+    index["bucket"][played] = np.bincount(codes)[codes]
+    if path is None:
+        path = index_path(lexicon, answers=answers)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        np.save(f, index)
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+    index = np.load(path, mmap_mode="r")
+    _indexes[path] = index
+    return index
+
+def load_index(lexicon=None, directory=None, answers=None):
+    """
+    Returns the difficulty index for lexicon and answer ids as a
+    read-only memory map, or None if it has not been built.  The file
+    is mapped at most once per process.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    path = index_path(lexicon, directory, _answer_ids(lexicon, answers))
+    if path not in _indexes:
+        index = None
+        if os.path.exists(path):
+            index = np.load(path, mmap_mode="r")
+            if index.shape != (len(lexicon),) or index.dtype != INDEX_DTYPE:
+                index = None
+        _indexes[path] = index
+    return _indexes[path]
+
+
+class AliasTable:
+    """
+    This class draws integers 0 ... n - 1 with probabilities proportional
+    to a list of weights, in constant time per draw, using Vose's alias
+    method.
+    """
+
+    def __init__(self, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        n = len(weights)
+        if n == 0 or weights.sum() <= 0:
+            raise ValueError("An alias table needs a positive weight")
+        scaled = weights * (n / weights.sum())
+        prob = np.ones(n)
+        alias = np.arange(n)
+        small = [ i for i in range(n) if scaled[i] < 1.0 ]
+        large = [ i for i in range(n) if scaled[i] >= 1.0 ]
+        while small and large:
+            s = small.pop()
+            g = large[-1]
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            if scaled[g] < 1.0:
+                small.append(large.pop())
+        self._prob = prob.tolist()
+        self._alias = alias.tolist()
+
+    def __len__(self):
+        return len(self._prob)
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self._prob))
+        if rng.random() < self._prob[i]:
+            return i
+        return self._alias[i]
+
+
+class DifficultyPicker:
+    """
+    This class picks answer ids from a difficulty band.  The answers are
+    ranked once, from easiest to hardest, and each band's alias table
+    is built the first time the band is used.
+    """
+
+    def __init__(self, index, answers):
+        answers = np.asarray(answers, dtype=np.intp)
+        rated = index[answers]
+        order = np.lexsort((rated["bucket"], rated["worst"], rated["expected"]))
+        self._answers = answers[order]
+        self._tables = { }
+
+    def table(self, band):
+        """Returns the alias table for a band name or a point from 0 to 1."""
+        target = BANDS.get(band, band)
+        if not isinstance(target, (int, float)) or not 0 <= target <= 1:
+            raise ValueError(f"Unknown difficulty band '{band}'")
+        table = self._tables.get(target)
+        if table is None:
+            n = len(self._answers)
+            rank = (np.arange(n) + 0.5) / n
+            table = AliasTable(np.exp(-0.5 * ((rank - target) / BAND_WIDTH) ** 2))
+            self._tables[target] = table
+        return table
+
+    def pick(self, band, rng=random):
+        """Returns an answer id drawn from band."""
+        return int(self._answers[self.table(band).sample(rng)])
+
+def difficulty(k, lexicon=None, answers=None):
+    """
+    Returns the expected number of guesses for answer k, or None if the
+    index for lexicon and answer ids has not been built.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    index = load_index(lexicon, answers=answers)
+    if index is None:
+        return None
+    return float(index["expected"][k])
+
+if __name__ == "__main__":
+    print(index_path(WordleLexicon.LEXICON))
+    build_index()
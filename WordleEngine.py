@@ -0,0 +1,410 @@
+# File: WordleEngine.py
+
+"""
+This module implements the rules of Wordle without any dependence on
+tkinter, so that games can be scored and played on headless machines.
+
+Feedback for a guess is encoded as a base-3 integer in which digit i
+is the state of letter i: MISSING (0), PRESENT (1) or CORRECT (2).
+For five-letter words the codes run from 0 to 242 and fit in a byte;
+for words of six to ten letters they need 16 bits.
+"""
+
+from array import array
+
+import WordleLexicon
+from WordleLexicon import LETTER_BITS, LETTER_MASK, N_LETTERS
+
+# Constants
+
+MISSING = 0                     # Letter does not appear (or is used up)
+PRESENT = 1                     # Letter appears in another position
+CORRECT = 2                     # Letter is in the correct position
+
+N_STATES = 3
+KEY_UNKNOWN = -1                # Keyboard state of a letter not yet guessed
+DEFAULT_ROWS = 6
+
+def score(guess, answer):
+    """
+    Returns the feedback code for guess against answer.  Both words
+    must have the same length and the same case.  Repeated letters in
+    the guess are marked PRESENT only as many times as they occur in
+    the answer outside the CORRECT positions.
+    """
+    remaining = { }
+    for g, a in zip(guess, answer):
+        if g != a:
+            remaining[a] = remaining.get(a, 0) + 1
+    code = 0
+    weight = 1
+    for g, a in zip(guess, answer):
+        if g == a:
+            code += CORRECT * weight
+        elif remaining.get(g, 0) > 0:
+            remaining[g] -= 1
+            code += PRESENT * weight
+        weight *= N_STATES
+    return code
+
+def decode(code, length):
+    """Returns the list of letter states encoded in a feedback code."""
+    states = [ ]
+    for _ in range(length):
+        states.append(code % N_STATES)
+        code //= N_STATES
+    return states
+
+def encode(states):
+    """Returns the feedback code for a sequence of letter states."""
+    code = 0
+    for state in reversed(states):
+        code = code * N_STATES + state
+    return code
+
+def solved_code(length):
+    """Returns the feedback code for a guess that matches the answer."""
+    return N_STATES ** length - 1
+
+def n_patterns(length):
+    """Returns the number of distinct feedback codes for a word length."""
+    return N_STATES ** length
+
+def feedback_typecode(length):
+    """
+    Returns the array typecode ("B" or "H") of the smallest unsigned
+    integer that holds every feedback code for a word length.  NumPy
+    accepts the same codes as dtypes.
+    """
+    if n_patterns(length) <= 1 << 8:
+        return "B"
+    return "H"
+
+
+def ordinal(n):
+    """Returns the English ordinal for n, such as 1st or 22nd."""
+    if n % 100 in (11, 12, 13):
+        return f"{n}th"
+    return f"{n}" + { 1: "st", 2: "nd", 3: "rd" }.get(n % 10, "th")
+
+
+class HardModeConstraints:
+    """
+    This class accumulates the hard-mode constraints for one game.
+    Hard mode requires every guess to keep the letters already marked
+    CORRECT in place and to use every letter already revealed.  The
+    constraints are kept in two forms.  A bitset over the lexicon holds
+    every legal guess, so checking a word or listing the legal guesses
+    takes a few integer operations.  A mask and value over the packed
+    letter code hold the fixed letters, so a rejected guess can be
+    explained without rescanning earlier rows.
+    """
+
+    def __init__(self, lexicon):
+        self._lexicon = lexicon
+        self.reset()
+
+    def reset(self):
+        self._legal = self._lexicon.all_mask
+        self._green_mask = 0
+        self._green_value = 0
+        self._required = { }
+
+    @property
+    def legal(self):
+        """The bitset of word ids that are legal guesses."""
+        return self._legal
+
+    def count(self):
+        """Returns the number of legal guesses."""
+        return self._legal.bit_count()
+
+    def ids(self):
+        return self._lexicon.ids(self._legal)
+
+    def update(self, guess, code):
+        """Adds the constraints revealed by the feedback code for guess."""
+        lexicon = self._lexicon
+        revealed = { }
+        for i, state in enumerate(decode(code, lexicon.length)):
+            ch = guess[i]
+            if state == CORRECT:
+                shift = LETTER_BITS * i
+                if not (self._green_mask >> shift) & LETTER_MASK:
+                    self._green_mask |= LETTER_MASK << shift
+                    self._green_value |= (ord(ch) - ord("a")) << shift
+                    self._legal &= lexicon.position_mask(i, ch)
+            if state != MISSING:
+                revealed[ch] = revealed.get(ch, 0) + 1
+        for ch, n in revealed.items():
+            if n > self._required.get(ch, 0):
+                self._required[ch] = n
+                self._legal &= lexicon.count_mask(ch, n)
+
+    def is_legal(self, word):
+        """Returns True if word is in the lexicon and meets the constraints."""
+        k = self._lexicon.index(word.lower())
+        return k >= 0 and (self._legal >> k) & 1 == 1
+
+    def violation(self, word):
+        """
+        Returns a message explaining why word breaks the constraints, or
+        None if it does not.
+        """
+        word = word.lower()
+        code = self._lexicon.encode(word)
+        if code & self._green_mask != self._green_value:
+            for i in range(self._lexicon.length):
+                shift = LETTER_BITS * i
+                mask = LETTER_MASK << shift
+                if (code ^ self._green_value) & self._green_mask & mask:
+                    ch = chr(ord("a") + ((self._green_value >> shift) & LETTER_MASK))
+                    return f"{ordinal(i + 1)} letter must be {ch.upper()}"
+        for ch, n in self._required.items():
+            if word.count(ch) < n:
+                if n == 1:
+                    return f"Guess must contain {ch.upper()}"
+                return f"Guess must contain {ch.upper()} {n} times"
+        return None
+
+
+class CandidateTracker:
+    """
+    This class counts the answers consistent with the feedback so far
+    and, among those, the ones that start with the letters typed into
+    the current row.  The consistent answers are kept as a bitset over
+    the lexicon, which each row narrows with one AND per letter.  The
+    typed prefix is a stack of bitsets with one entry per letter, so
+    typing or deleting a letter is one AND or one pop, and the counts
+    shown while typing never rescan the word list.
+    """
+
+    def __init__(self, lexicon, answers=None):
+        self._lexicon = lexicon
+        if answers is None:
+            self._answers = lexicon.all_mask
+        else:
+            self._answers = lexicon.mask(answers)
+        self.reset()
+
+    def reset(self):
+        self._candidates = self._answers
+        self.clear_prefix()
+
+    @property
+    def candidates(self):
+        """The bitset of answers consistent with the feedback."""
+        return self._candidates
+
+    @property
+    def prefix(self):
+        """The letters typed into the current row."""
+        return "".join(self._letters)
+
+    def count(self):
+        return self._candidates.bit_count()
+
+    def prefix_count(self):
+        return self._prefix[-1].bit_count()
+
+    def push(self, ch):
+        """
+        Adds a letter to the typed prefix.  Anything but a single letter
+        from a to z is ignored, since no word can contain it.
+        """
+        i = len(self._letters)
+        ch = ch.lower()
+        if i >= self._lexicon.length or len(ch) != 1 or not "a" <= ch <= "z":
+            return
+        self._prefix.append(self._prefix[-1] & self._lexicon.position_mask(i, ch))
+        self._letters.append(ch)
+
+    def pop(self):
+        """Removes the last letter from the typed prefix."""
+        if self._letters:
+            self._prefix.pop()
+            self._letters.pop()
+
+    def clear_prefix(self):
+        self._prefix = [ self._candidates ]
+        self._letters = [ ]
+
+    def update(self, guess, code):
+        """
+        Keeps the answers that would give the feedback code for guess
+        and clears the typed prefix.
+        """
+        lexicon = self._lexicon
+        guess = guess.lower()
+        mask = self._candidates
+        marked = { }
+        capped = set()
+        for i, state in enumerate(decode(code, lexicon.length)):
+            ch = guess[i]
+            at = lexicon.position_mask(i, ch)
+            if state == CORRECT:
+                mask &= at
+            else:
+                mask &= ~at
+            if state == MISSING:
+                capped.add(ch)
+            else:
+                marked[ch] = marked.get(ch, 0) + 1
+        for ch in set(guess):
+            n = marked.get(ch, 0)
+            mask &= lexicon.count_mask(ch, n)
+            if ch in capped:
+                mask &= ~lexicon.count_mask(ch, n + 1)
+        self._candidates = mask
+        self.clear_prefix()
+
+
+class KeyboardState:
+    """
+    This class keeps the best state known for every letter, ordered
+    from KEY_UNKNOWN through MISSING and PRESENT to CORRECT.  The states
+    are one small integer per letter, and each guess can only raise
+    them, so update reports just the keys whose color changes.  If
+    states is given, the class works on the N_LETTERS entries of that
+    signed-byte array starting at offset instead of on its own array,
+    which lets compact game stores keep the keyboard of every game.
+    """
+
+    def __init__(self, states=None, offset=0):
+        self._offset = offset
+        if states is None:
+            self._states = array("b", [ KEY_UNKNOWN ]) * N_LETTERS
+        else:
+            self._states = states
+
+    def reset(self):
+        self._states[self._offset:self._offset + N_LETTERS] = \
+            array("b", [ KEY_UNKNOWN ]) * N_LETTERS
+
+    def state(self, ch):
+        return self._states[self._offset + ord(ch.lower()) - ord("a")]
+
+    def update(self, guess, code):
+        """
+        Raises the letter states using the feedback code for guess and
+        returns the list of (letter, state) pairs that changed.
+        """
+        changes = { }
+        for ch, state in zip(guess.lower(), decode(code, len(guess))):
+            k = self._offset + ord(ch) - ord("a")
+            if state > self._states[k]:
+                self._states[k] = state
+                changes[ch] = state
+        return list(changes.items())
+
+
+class GameEngine:
+    """This class tracks the state of one game against a fixed answer."""
+
+    def __init__(self, answer, lexicon=None, n_rows=DEFAULT_ROWS,
+                 hard_mode=False):
+        """
+        Creates a game whose answer is the word answer.  The lexicon
+        defaults to the one built from the standard dictionary.
+        """
+        if lexicon is None:
+            lexicon = WordleLexicon.LEXICON
+        answer = answer.lower()
+        if answer not in lexicon:
+            raise ValueError(f"Answer '{answer}' is not in the lexicon")
+        self._lexicon = lexicon
+        self._answer = answer
+        self._n_rows = n_rows
+        self._guesses = [ ]
+        self._feedback = [ ]
+        self._solved = solved_code(lexicon.length)
+        self._hard = HardModeConstraints(lexicon) if hard_mode else None
+        self._keyboard = KeyboardState()
+        self._key_changes = [ ]
+
+    @property
+    def answer(self):
+        return self._answer
+
+    @property
+    def n_rows(self):
+        return self._n_rows
+
+    @property
+    def row(self):
+        """The number of guesses made so far."""
+        return len(self._guesses)
+
+    @property
+    def guesses(self):
+        return list(self._guesses)
+
+    @property
+    def feedback(self):
+        return list(self._feedback)
+
+    @property
+    def keyboard(self):
+        return self._keyboard
+
+    @property
+    def key_changes(self):
+        """The (letter, state) pairs changed by the last guess."""
+        return list(self._key_changes)
+
+    def is_won(self):
+        return len(self._feedback) > 0 and self._feedback[-1] == self._solved
+
+    def is_over(self):
+        return self.is_won() or len(self._guesses) >= self._n_rows
+
+    @property
+    def hard_mode(self):
+        return self._hard is not None
+
+    def set_hard_mode(self, flag):
+        """Turns hard mode on or off, which is allowed only before the first guess."""
+        if flag == self.hard_mode:
+            return
+        if len(self._guesses) > 0:
+            raise ValueError("Hard mode can only be changed before the first guess")
+        self._hard = HardModeConstraints(self._lexicon) if flag else None
+
+    def is_valid(self, s):
+        return self._lexicon.is_valid(s)
+
+    def check(self, s):
+        """
+        Returns a message explaining why s cannot be played now, or None
+        if it can.
+        """
+        if self.is_over():
+            return "The game is already over"
+        if not self._lexicon.is_valid(s):
+            return "Not a valid word. Try again!"
+        if self._hard is not None:
+            return self._hard.violation(s)
+        return None
+
+    def submit(self, s):
+        """
+        Scores the guess s, records it and returns its feedback code.
+        Raises ValueError if the game is over, s is not a word or s
+        breaks the hard-mode rule.
+        """
+        if self.is_over():
+            raise ValueError("The game is already over")
+        guess = s.lower()
+        if guess not in self._lexicon:
+            raise ValueError(f"'{s}' is not a valid word")
+        if self._hard is not None:
+            problem = self._hard.violation(guess)
+            if problem is not None:
+                raise ValueError(problem)
+        code = score(guess, self._answer)
+        if self._hard is not None:
+            self._hard.update(guess, code)
+        self._key_changes = self._keyboard.update(guess, code)
+        self._guesses.append(guess)
+        self._feedback.append(code)
+        return code
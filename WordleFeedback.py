@@ -0,0 +1,229 @@
+# File: WordleFeedback.py
+
+"""
+This module computes Wordle feedback codes with NumPy.  It scores one
+guess against many answers (or many guesses against one answer) in a
+single call, and it builds the guess-by-answer feedback matrix for a
+lexicon and caches that matrix on disk, where later processes can
+memory-map it instead of building it again.
+
+Running this file as a program builds the cache for the default
+lexicon.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+import WordleLexicon
+from WordleEngine import CORRECT, N_STATES, PRESENT, feedback_typecode
+from WordleLexicon import LETTER_BITS, LETTER_MASK, N_LETTERS
+from WordlePaths import cache_dir
+
+# Constants
+
+FORMAT_VERSION = 1              # Bump when the file layout changes
+BLOCK_ROWS = 256                # Guesses scored per block in build_matrix
+
+_letter_matrices = { }
+_letter_counts = { }
+
+def letter_matrix(lexicon):
+    """
+    Returns an array of shape (len(lexicon), lexicon.length) holding
+    the letter numbers (a = 0 ... z = 25) of every word.  The array is
+    unpacked from the lexicon's codes once and then reused.
+    """
+    key = lexicon.content_hash
+    letters = _letter_matrices.get(key)
+    if letters is None:
+        dtype = np.dtype(lexicon.codes.typecode)
+        codes = np.frombuffer(lexicon.codes, dtype=dtype)
+        shifts = LETTER_BITS * np.arange(lexicon.length, dtype=dtype)
+        letters = ((codes[:, None] >> shifts) & LETTER_MASK).astype(np.uint8)
+        letters.flags.writeable = False
+        _letter_matrices[key] = letters
+    return letters
+
+def letter_counts(lexicon):
+    """
+    Returns an array of shape (len(lexicon), 26) in which entry [k, c]
+    is the number of times letter c occurs in word k.
+    """
+    key = lexicon.content_hash
+    counts = _letter_counts.get(key)
+    if counts is None:
+        letters = letter_matrix(lexicon)
+        rows = np.arange(len(lexicon))
+        counts = np.zeros((len(lexicon), N_LETTERS), dtype=np.int8)
+        for j in range(lexicon.length):
+            counts[rows, letters[:, j]] += 1
+        counts.flags.writeable = False
+        _letter_counts[key] = counts
+    return counts
+
+def _score(guesses, answers, counts):
+    """
+    Returns the feedback codes for letter arrays whose last axis runs
+    over letter positions.  The guesses and answers broadcast against
+    each other, and counts holds the letter counts of the answers,
+    shaped like answers but with 26 entries on the last axis.  The
+    loops below run over letter positions only, never over words.
+    """
+    length = guesses.shape[-1]
+    green = guesses == answers
+    codes = np.zeros(green.shape[:-1], dtype=np.int32)
+    present = [ ]
+    weight = 1
+    for i in range(length):
+        same = guesses == guesses[..., i:i + 1]
+        letter = guesses[..., i:i + 1].astype(np.intp)
+        available = np.take_along_axis(counts, letter, axis=-1)[..., 0]
+        available = np.broadcast_to(available, codes.shape).astype(np.int8)
+        for j in range(length):
+            available -= green[..., j] & same[..., j]
+        for k in range(i):
+            available -= present[k] & same[..., k]
+        is_present = ~green[..., i] & (available > 0)
+        present.append(is_present)
+        codes += weight * (CORRECT * green[..., i] + PRESENT * is_present)
+        weight *= N_STATES
+    return codes
+
+def _score_block(guesses, answers, counts):
+    """
+    Returns the feedback codes for every pair in the cross product of
+    two letter arrays, as an array of shape (len(guesses), len(answers)).
+    """
+    return _score(guesses[:, None, :], answers[None, :, :], counts[None, :, :])
+
+def feedback_dtype(lexicon):
+    """Returns the NumPy dtype of feedback codes for lexicon: uint8 or uint16."""
+    return np.dtype(feedback_typecode(lexicon.length))
+
+def _as_ids(lexicon, words):
+    """
+    Converts words to an array of word ids.  The argument may be None
+    (meaning every word), a single word or id, a sequence of words, or
+    a sequence or array of ids.
+    """
+    if words is None:
+        return np.arange(len(lexicon))
+    if isinstance(words, (str, int, np.integer)):
+        words = [ words ]
+    if len(words) > 0 and isinstance(words[0], str):
+        ids = [ lexicon.index(word.lower()) for word in words ]
+        if -1 in ids:
+            raise ValueError(f"'{words[ids.index(-1)]}' is not in the lexicon")
+        return np.array(ids, dtype=np.intp)
+    return np.asarray(words, dtype=np.intp)
+
+def score_many(guess, answers=None, lexicon=None):
+    """
+    Returns the feedback codes for one guess against many answers, as
+    an array of feedback_dtype(lexicon).  The guess is a word or word id; answers is
+    anything accepted by _as_ids and defaults to the whole lexicon.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    letters = letter_matrix(lexicon)
+    counts = letter_counts(lexicon)
+    g = _as_ids(lexicon, guess)
+    a = _as_ids(lexicon, answers)
+    return _score_block(letters[g], letters[a], counts[a])[0].astype(feedback_dtype(lexicon))
+
+def score_many_guesses(guesses, answer, lexicon=None):
+    """
+    Returns the feedback codes for many guesses against one answer, as
+    an array of feedback_dtype(lexicon).  The arguments mirror those of score_many.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    letters = letter_matrix(lexicon)
+    counts = letter_counts(lexicon)
+    g = _as_ids(lexicon, guesses)
+    a = _as_ids(lexicon, answer)
+    return _score_block(letters[g], letters[a], counts[a])[:, 0].astype(feedback_dtype(lexicon))
+
+def score_pairs(guesses, answers, lexicon=None):
+    """
+    Returns the feedback code for each guess id against the answer id at
+    the same position, as an array of feedback_dtype(lexicon).
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    letters = letter_matrix(lexicon)
+    counts = letter_counts(lexicon)
+    g = np.asarray(guesses, dtype=np.intp)
+    a = np.asarray(answers, dtype=np.intp)
+    return _score(letters[g], letters[a], counts[a]).astype(feedback_dtype(lexicon))
+
+def matrix_path(lexicon, directory=None):
+    """Returns the cache file name for the feedback matrix of lexicon."""
+    if directory is None:
+        directory = cache_dir()
+    name = f"feedback-v{FORMAT_VERSION}-{lexicon.content_hash[:16]}.npy"
+    return os.path.join(directory, name)
+
+def build_matrix(lexicon=None, path=None):
+    """
+    Computes the feedback matrix for lexicon, in which entry [g, a] is
+    the feedback code for guess id g against answer id a.  If path is
+    given, the matrix is written to that file and returned as a
+    read-only memory map; otherwise it is returned as an ordinary array.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    letters = letter_matrix(lexicon)
+    counts = letter_counts(lexicon)
+    n = len(lexicon)
+    dtype = feedback_dtype(lexicon)
+    if path is None:
+        matrix = np.empty((n, n), dtype=dtype)
+    else:
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        os.chmod(tmp, 0o644)
+        matrix = np.lib.format.open_memmap(tmp, mode="w+",
+                                           dtype=dtype, shape=(n, n))
+    for start in range(0, n, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, n)
+        matrix[start:stop] = _score_block(letters[start:stop], letters, counts)
+    if path is None:
+        return matrix
+    matrix.flush()
+    del matrix
+    os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+def load_matrix(lexicon=None, directory=None):
+    """
+    Returns the cached feedback matrix for lexicon as a read-only
+    memory map, or None if it has not been built.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    path = matrix_path(lexicon, directory)
+    if not os.path.exists(path):
+        return None
+    matrix = np.load(path, mmap_mode="r")
+    if (matrix.shape != (len(lexicon), len(lexicon))
+            or matrix.dtype != feedback_dtype(lexicon)):
+        return None
+    return matrix
+
+def get_matrix(lexicon=None, directory=None):
+    """Returns the feedback matrix for lexicon, building it if needed."""
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    matrix = load_matrix(lexicon, directory)
+    if matrix is None:
+        matrix = build_matrix(lexicon, matrix_path(lexicon, directory))
+    return matrix
+
+if __name__ == "__main__":
+    print(matrix_path(WordleLexicon.LEXICON))
+    get_matrix(WordleLexicon.LEXICON)
@@ -5,10 +5,14 @@ This file implements the WordleGWindow class, which manages the
 graphical display for the Wordle project.
 """
 
-import atexit
+import asyncio
 import time
 import tkinter as tk
-from WordleDictionary import FIVE_LETTER_WORDS
+import _tkinter
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+import WordleLexicon
+from WordleEngine import CORRECT, MISSING, PRESENT, decode, ordinal
 
 # Constants
 
@@ -30,6 +34,7 @@ MESSAGE_SEP = 20                # Space between board and message center
 
 SQUARE_FONT = ("Helvetica Neue", -44, "bold")
 MESSAGE_FONT = ("Helvetica Neue", -20, "bold")
+STATUS_FONT = ("Helvetica Neue", -14)
 KEY_FONT = ("Helvetica Neue", -18)
 ENTER_FONT = ("Helvetica Neue", -14)
 
@@ -45,6 +50,37 @@ KEY_LABELS = [
     [ "ENTER", "Z", "X", "C", "V", "B", "N", "M", "DELETE" ]
 ]
 
+AZERTY_LABELS = [
+    [ "A", "Z", "E", "R", "T", "Y", "U", "I", "O", "P" ],
+    [ "Q", "S", "D", "F", "G", "H", "J", "K", "L", "M" ],
+    [ "ENTER", "W", "X", "C", "V", "B", "N", "DELETE" ]
+]
+
+KEYBOARD_LAYOUTS = {
+    "qwerty": KEY_LABELS,
+    "azerty": AZERTY_LABELS,
+}
+
+POLL_MIN_INTERVAL = 0.002       # Seconds between polls while events arrive
+POLL_MAX_INTERVAL = 0.05        # Seconds between polls when Tk is idle
+POLL_MAX_EVENTS = 100           # Tk events handled before yielding to asyncio
+
+BACKGROUND_POLL_MS = 10         # Milliseconds between checks on background work
+
+# A Tcl procedure that applies a batch of changes as alternating item
+# ids and option lists, so a frame of changes needs one call into Tcl
+
+APPLY_COMMAND = "::wordle::apply_changes"
+APPLY_PROC = """
+namespace eval ::wordle {
+    proc apply_changes {canvas batch} {
+        foreach {item options} $batch {
+            $canvas itemconfigure $item {*}$options
+        }
+    }
+}
+"""
+
 CLICK_MAX_DISTANCE = 2
 CLICK_MAX_DELAY = 0.5
 
@@ -55,49 +91,55 @@ BOARD_WIDTH = N_COLS * SQUARE_SIZE + (N_COLS - 1) * SQUARE_SEP
 BOARD_HEIGHT = N_ROWS * SQUARE_SIZE + (N_ROWS - 1) * SQUARE_SEP
 MESSAGE_X = CANVAS_WIDTH / 2
 MESSAGE_Y = TOP_MARGIN + BOARD_HEIGHT + MESSAGE_SEP
+STATUS_Y = TOP_MARGIN / 2
+KEYBOARD_HEIGHT = 3 * KEY_HEIGHT + 2 * KEY_YSEP
 
 class WordleGWindow:
     """This class creates the Wordle window."""
 
-    def __init__(self):
-        """Creates the Wordle window."""
+    def __init__(self, lexicon=None, layout="qwerty", key_scale=1.0):
+        """
+        Creates the Wordle window.  Words are checked against lexicon,
+        which defaults to the standard dictionary.  The on-screen
+        keyboard uses the named layout, with keys key_scale times the
+        usual size; the window grows to fit a larger keyboard.
+        """
 
         def create_grid():
+            left = (canvas_width - BOARD_WIDTH) / 2
             return [
                 [
-                    WordleSquare(canvas, i, j) for j in range(N_COLS)
+                    WordleSquare(canvas, i, j, renderer, left) for j in range(N_COLS)
                 ] for i in range(N_ROWS)
             ]
 
         def create_keyboard():
             keys = { }
-            nk = len(KEY_LABELS[0])
-            h = KEY_HEIGHT
-            y0 = CANVAS_HEIGHT - BOTTOM_MARGIN - 3 * KEY_HEIGHT - 2 * KEY_YSEP
-            for row in range(len(KEY_LABELS)):
-                y = y0 + row * (KEY_HEIGHT + KEY_YSEP)
-                x = (CANVAS_WIDTH - nk * KEY_WIDTH - (nk - 1) * KEY_XSEP) / 2
-                if row == 1:
-                    x += (KEY_WIDTH + KEY_XSEP) / 2
-                for col in range(len(KEY_LABELS[row])):
-                    label = KEY_LABELS[row][col]
-                    w = KEY_WIDTH
-                    if len(label) > 1:
-                        w += (KEY_WIDTH + KEY_XSEP) / 2
-                    keys[label] = WordleKey(self._canvas, x, y, w, h, label)
-                    x += w + KEY_XSEP
+            for label, x, y, w, h in self._layout.keys():
+                keys[label] = WordleKey(self._canvas, x, y, w, h, label,
+                                        renderer, key_scale)
             return keys
 
         def create_message():
             return WordleMessage(self._canvas,
-                                CANVAS_WIDTH / 2,
-                                MESSAGE_Y)
+                                canvas_width / 2,
+                                MESSAGE_Y,
+                                renderer)
+
+        def create_status():
+            return WordleMessage(self._canvas,
+                                canvas_width / 2,
+                                STATUS_Y,
+                                renderer,
+                                STATUS_FONT)
 
         def key_action(tke):
             if isinstance(tke, str):
                 ch = tke.upper()
             else:
                 ch = tke.char.upper()
+            if ch:
+                self.cancel_background()
             
             #if the user presses the DELETE button on the screen or keyboard
             if ch in ["\007", "\177", "\x08", "\x7F", "DELETE"]:
@@ -106,6 +148,8 @@ class WordleGWindow:
                     self._col -= 1
                     sq = self._grid[self._row][self._col]
                     sq.set_letter(" ")
+                    for fn in self._typing_listeners:
+                        fn(self._col, " ")
             # if user presses ENTER or TAB keys
             elif ch in ["\r", "\n", "\t", "ENTER"]:
                 self.show_message("")
@@ -113,22 +157,28 @@ class WordleGWindow:
                 for col in range(N_COLS):
                     s += self._grid[self._row][col].get_letter()
                 
+                # a listener returns False to reject the word
+                accepted = True
                 for fn in self._enter_listeners:
-                    fn(s)
+                    if fn(s) is False:
+                        accepted = False
 
                 # move to next row if not at last row and word exists in dictionary
-                if (self._row < (N_ROWS - 1)) and (s.lower() in FIVE_LETTER_WORDS):
+                if accepted and (self._row < (N_ROWS - 1)) and self._is_valid(s):
                     current_row = self._row
                     self.set_current_row(current_row + 1)
                 # show  that the user didn't guess it right
-                elif (self._row == (N_ROWS - 1)):
+                elif accepted and (self._row == (N_ROWS - 1)):
                     self.show_stats()
                 
-            elif ch.isalpha():
+            # only the letters A to Z can appear in a word
+            elif len(ch) == 1 and "A" <= ch <= "Z":
                 self.show_message("")
                 if self._row < N_ROWS and self._col < N_COLS:
                     sq = self._grid[self._row][self._col]
                     sq.set_letter(ch)
+                    for fn in self._typing_listeners:
+                        fn(self._col, ch)
                     self._col += 1
 
         def press_action(tke):
@@ -146,41 +196,62 @@ class WordleGWindow:
                             key_action(key._label)
 
         def find_key(x, y):
-            for key in self._keys.values():
-                kx, ky, kw, kh = key._bounds
-                if x >= kx and x <= kx + kw and y >= ky and y <= ky + kh:
-                    return key
-            return None
+            label = self._layout.find(x, y)
+            if label is None:
+                return None
+            return self._keys[label]
 
         def delete_window():
             """Closes the window and exits from the event loop."""
             root.destroy()
 
-        def start_event_loop():
-            """Starts the tkinter event loop when the program exits."""
-            root.mainloop()
-
+        def destroy_action(tke):
+            if tke.widget is root:
+                self._closed = True
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+
+        if layout not in KEYBOARD_LAYOUTS:
+            raise ValueError(f"Unknown keyboard layout '{layout}'")
+        keyboard = KeyboardLayout(KEYBOARD_LAYOUTS[layout], key_scale)
+        canvas_width = max(CANVAS_WIDTH, keyboard.width + 2 * KEY_XSEP)
+        canvas_height = CANVAS_HEIGHT + keyboard.height - KEYBOARD_HEIGHT
+        keyboard.place((canvas_width - keyboard.width) / 2,
+                       canvas_height - BOTTOM_MARGIN - keyboard.height,
+                       canvas_width)
+        self._layout = keyboard
         root = tk.Tk()
         root.title("Wordle")
         root.protocol("WM_DELETE_WINDOW", delete_window)
         self._root = root
         canvas = tk.Canvas(root,
                                 bg="White",
-                                width=CANVAS_WIDTH,
-                                height=CANVAS_HEIGHT,
+                                width=canvas_width,
+                                height=canvas_height,
                                 highlightthickness=0)
         canvas.pack()
         self._canvas = canvas
+        renderer = CanvasRenderer(canvas)
+        self._renderer = renderer
         self._grid = create_grid()
         self._message = create_message()
+        self._status = create_status()
         self._keys = create_keyboard()
+        self._lexicon = lexicon
         self._enter_listeners = []
+        self._hint_listeners = []
+        self._typing_listeners = []
+        self._stats = None
         root.bind("<Key>", key_action)
         root.bind("<ButtonPress-1>", press_action)
         root.bind("<ButtonRelease-1>", release_action)
+        root.bind("<Destroy>", destroy_action)
         self._row = 0
         self._col = 0
-        atexit.register(start_event_loop)
+        self._closed = False
+        self._executor = None
+        self._background = [ ]
+        self._polling = False
 
         # Create a dropdown menu
         self.dropdown_var = tk.StringVar()
@@ -191,7 +262,93 @@ class WordleGWindow:
         # Button to apply selected mode
         self.apply_button = tk.Button(root, text="Apply", command=self.apply_mode)
         self.apply_button.pack(pady=5)
+
+        # Checkbox for hard mode, which is read when the first guess is entered
+        self.hard_mode_var = tk.BooleanVar(value=False)
+        self.hard_mode_check = tk.Checkbutton(root, text="Hard Mode",
+                                              variable=self.hard_mode_var)
+        self.hard_mode_check.pack(pady=5)
+
+        # Button to ask the solver for a hint
+        self.hint_button = tk.Button(root, text="Hint", command=self.hint_action)
+        self.hint_button.pack(pady=5)
         
+    def run(self):
+        """Runs the tkinter event loop until the window is closed."""
+        if not self._closed:
+            self._root.mainloop()
+
+    async def run_async(self):
+        """
+        Runs the window from the running asyncio event loop until it is
+        closed.  Pending Tk events are handled in short bursts, and the
+        wait between bursts doubles while Tk is idle, so an idle window
+        costs little and a busy one stays responsive.
+        """
+        interval = POLL_MIN_INTERVAL
+        while not self._closed:
+            handled = 0
+            while (handled < POLL_MAX_EVENTS and not self._closed
+                   and self._root.tk.dooneevent(_tkinter.DONT_WAIT)):
+                handled += 1
+            if handled > 0:
+                interval = POLL_MIN_INTERVAL
+            else:
+                interval = min(2 * interval, POLL_MAX_INTERVAL)
+            await asyncio.sleep(interval)
+
+    def is_closed(self):
+        return self._closed
+
+    def run_in_background(self, fn, *args, callback=None):
+        """
+        Calls fn(*args) in a worker thread and returns its Future.  When
+        it finishes, callback is called with the result on the tkinter
+        thread, unless the work has been cancelled by then.  If fn
+        raises an exception, the error is shown as the message instead.
+        Typing a key or moving to a new row cancels all background work.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="wordle")
+        future = self._executor.submit(fn, *args)
+        self._background.append((future, callback))
+        self._schedule_poll()
+        return future
+
+    def cancel_background(self):
+        """Cancels the background work that has not yet been delivered."""
+        for future, _ in self._background:
+            future.cancel()
+        self._background = [ ]
+
+    def _poll_background(self):
+        self._polling = False
+        if self._closed:
+            return
+        pending = [ ]
+        finished = [ ]
+        for item in self._background:
+            if item[0].done():
+                finished.append(item)
+            else:
+                pending.append(item)
+        self._background = pending
+        for future, callback in finished:
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                self.show_message(f"Error: {error}")
+            elif callback is not None:
+                callback(future.result())
+        self._schedule_poll()
+
+    def _schedule_poll(self):
+        if self._background and not self._polling:
+            self._root.after(BACKGROUND_POLL_MS, self._poll_background)
+            self._polling = True
+
     def get_square_letter(self, row, col):
         return self._grid[row][col].get_letter()
 
@@ -204,47 +361,122 @@ class WordleGWindow:
     def set_square_color(self, row, col, color):
         self._grid[row][col].set_color(color)
 
+    def show_feedback(self, row, code):
+        """Colors the squares in row using a feedback code from the engine."""
+        CORRECT_COLOR, PRESENT_COLOR = self.apply_mode()
+        colors = { CORRECT: CORRECT_COLOR, PRESENT: PRESENT_COLOR }
+        for col, state in enumerate(decode(code, N_COLS)):
+            self.set_square_color(row, col, colors.get(state, MISSING_COLOR))
+
     def get_key_color(self, ch):
         return self._keys[ch].get_color()
 
     def set_key_color(self, ch, color):
         self._keys[ch].set_color(color)
 
+    def update_keys(self, changes):
+        """
+        Recolors the keys named in a list of (letter, state) changes
+        from the engine, leaving every other key alone.  The new colors
+        reach Tk together in the renderer's next batch.
+        """
+        CORRECT_COLOR, PRESENT_COLOR = self.apply_mode()
+        colors = { CORRECT: CORRECT_COLOR, PRESENT: PRESENT_COLOR,
+                   MISSING: MISSING_COLOR }
+        for ch, state in changes:
+            self.set_key_color(ch.upper(), colors[state])
+
     def get_current_row(self):
         return self._row
 
+    def add_frame_listener(self, fn):
+        """
+        Adds a function that is called with the number of canvas items
+        changed each time the pending display changes are applied.
+        """
+        self._renderer.add_frame_listener(fn)
+
     def set_current_row(self, row):
+        self.cancel_background()
         self._row = row
         self._col = 0
         for col in range(N_COLS):
             self.set_square_letter(row, col, " ")
             self.set_square_color(row, col, UNKNOWN_COLOR)
 
+    def _is_valid(self, s):
+        if self._lexicon is None:
+            self._lexicon = WordleLexicon.LEXICON
+        return self._lexicon.is_valid(s)
+
     def add_enter_listener(self, fn):
         self._enter_listeners.append(fn)
 
+    def add_typing_listener(self, fn):
+        """
+        Adds a function that is called as fn(col, ch) whenever a letter
+        is typed into column col of the current row, or with ch equal
+        to " " when the letter in column col is deleted.
+        """
+        self._typing_listeners.append(fn)
+
+    def is_hard_mode(self):
+        return self.hard_mode_var.get()
+
+    def add_hint_listener(self, fn):
+        self._hint_listeners.append(fn)
+
+    def hint_action(self):
+        for fn in self._hint_listeners:
+            fn()
+
     def show_message(self, msg, color="Black"):
         self._message.set_text(msg, color)
 
-    def show_stats(self):
-        stats = {
-            1: "You are among the elite!\n0.02% of Wordle users get it on their first try." ,
-            2: "You are AWESOME!\n5.67% of Wordle users get it on their second guess.",
-            3: "You are really good!\n22.66% of Wordle users get it on their third guess.",
-            4: "You are good!\n33.10% of Wordle users get it on their fourth guess.",
-            5: "You are pretty average!\n23.91% of Wordle users get it on their fifth guess.",
-            6: "You barely squeaked by!\n11.72% of Wordle users get it on their sixth guess.",
-            "No": "Good try!\n2.92% of Wordle users guess don't guess it right."
+    def show_status(self, msg):
+        """Shows msg in the status line above the board."""
+        self._status.set_text(msg)
+
+    def set_stats(self, stats):
+        """Sets the GameStats whose figures are shown after a game."""
+        self._stats = stats
+
+    def show_stats(self, n_guesses=None):
+        """
+        Shows the result of a game that took n_guesses guesses, or that
+        was lost if n_guesses is 0.  By default the result is the last
+        game recorded in the statistics, or else the current row.
+        """
+        praise = {
+            1: "You are among the elite!",
+            2: "You are AWESOME!",
+            3: "You are really good!",
+            4: "You are good!",
+            5: "You are pretty average!",
+            6: "You barely squeaked by!",
         }
-        num_guesses = self._row + 1
-        if num_guesses > 6:
+        stats = self._stats
+        if n_guesses is None:
+            if stats is not None and stats.last_result is not None:
+                n_guesses = stats.last_result
+            else:
+                n_guesses = self._row + 1
+        if n_guesses == 0 or n_guesses > N_ROWS:
             title = "You didn't guess it"
-            message = stats['No']
-            CustomPopup(self._root, title, message)
+            message = "Good try!"
+            if stats is not None:
+                message += f"\n{100 * stats.share(0):.2f}% of games are lost."
         else:
-            title = f"You guessed it in {num_guesses} tries."
-            message = stats[num_guesses]
-            CustomPopup(self._root, title, message)
+            title = f"You guessed it in {n_guesses} tries."
+            message = praise.get(n_guesses, "You did it!")
+            if stats is not None:
+                message += (f"\n{100 * stats.share(n_guesses):.2f}% of games "
+                            f"are won on the {ordinal(n_guesses)} guess.")
+        if stats is not None:
+            message += (f"\n{stats.games} played, "
+                        f"{100 * stats.win_rate():.0f}% won, "
+                        f"streak {stats.streak} (best {stats.max_streak})")
+        CustomPopup(self._root, title, message)
 
     # applies 
     def apply_mode(self):
@@ -279,14 +511,153 @@ class CustomPopup(tk.Toplevel):
         # Close the entire application when the dialog is closed, so they can't go back to the game
         self.parent.destroy()
 
+class KeyboardLayout:
+    """
+    This class lays out rows of key labels and finds the key under a
+    point.  Each row is centered, and keys with long labels are half a
+    key wider.  Once the layout is placed, a click is resolved with two
+    table lookups: the row comes from the click's band of y values and
+    the key from a table with one entry per pixel column of that row.
+    """
+
+    def __init__(self, labels, scale=1.0):
+        self._labels = [ list(row) for row in labels ]
+        self._key_width = KEY_WIDTH * scale
+        self._key_height = KEY_HEIGHT * scale
+        self._xsep = KEY_XSEP * scale
+        self._ysep = KEY_YSEP * scale
+        self._widths = [ [ self._width(label) for label in row ]
+                         for row in self._labels ]
+        self.width = max(sum(row) + (len(row) - 1) * self._xsep
+                         for row in self._widths)
+        self.height = (len(self._labels) * self._key_height
+                       + (len(self._labels) - 1) * self._ysep)
+        self._keys = [ ]
+        self._columns = [ ]
+
+    def _width(self, label):
+        if len(label) > 1:
+            return self._key_width * 1.5 + self._xsep / 2
+        return self._key_width
+
+    def place(self, x0, y0, canvas_width):
+        """
+        Positions the keyboard with its top left corner at (x0, y0) on
+        a canvas canvas_width pixels wide and builds the click tables.
+        """
+        self._top = y0
+        self._pitch = self._key_height + self._ysep
+        self._keys = [ ]
+        self._columns = [ ]
+        for r, row in enumerate(self._labels):
+            y = y0 + r * self._pitch
+            row_width = sum(self._widths[r]) + (len(row) - 1) * self._xsep
+            x = x0 + (self.width - row_width) / 2
+            columns = array("h", [ -1 ]) * (int(canvas_width) + 1)
+            for k, label in enumerate(row):
+                w = self._widths[r][k]
+                self._keys.append((label, x, y, w, self._key_height))
+                for px in range(max(0, int(x + 0.999)),
+                                min(len(columns), int(x + w) + 1)):
+                    columns[px] = k
+                x += w + self._xsep
+            self._columns.append(columns)
+
+    def keys(self):
+        """Returns a list of (label, x, y, width, height) tuples."""
+        return list(self._keys)
+
+    def find(self, x, y):
+        """Returns the label of the key at (x, y), or None."""
+        row = int((y - self._top) // self._pitch)
+        if row < 0 or row >= len(self._columns):
+            return None
+        if y - self._top - row * self._pitch > self._key_height:
+            return None
+        columns = self._columns[row]
+        if x < 0 or x >= len(columns):
+            return None
+        k = columns[int(x)]
+        if k < 0:
+            return None
+        return self._labels[row][k]
+
+
+class CanvasRenderer:
+    """
+    This class batches the option changes made to canvas items, so
+    that changes to the squares, keys and message are not sent to Tk
+    one by one.  Each change is recorded against its item, replacing
+    any earlier change to the same option, and the batch is applied
+    from an after_idle callback.  Options already shown with the same
+    value are skipped.  The whole batch crosses into Tcl in a single
+    call, which runs itemconfigure for each changed item there.
+    """
+
+    def __init__(self, canvas):
+        self._canvas = canvas
+        self._shown = { }
+        self._dirty = { }
+        self._scheduled = False
+        self._frame_listeners = [ ]
+        self.frames = 0
+        self.items = 0
+        self.last_frame_items = 0
+        canvas.tk.eval(APPLY_PROC)
+
+    def track(self, item, **options):
+        """Records the options an item was created with."""
+        self._shown.setdefault(item, { }).update(options)
+
+    def configure(self, item, **options):
+        """Sets options of an item at the next flush."""
+        shown = self._shown.get(item, { })
+        dirty = self._dirty.get(item)
+        for name, value in options.items():
+            if shown.get(name) == value:
+                if dirty is not None:
+                    dirty.pop(name, None)
+            else:
+                if dirty is None:
+                    dirty = self._dirty.setdefault(item, { })
+                dirty[name] = value
+        if self._dirty and not self._scheduled:
+            self._canvas.after_idle(self.flush)
+            self._scheduled = True
+
+    def flush(self):
+        """Applies every pending change in one Tcl call."""
+        self._scheduled = False
+        batch = [ ]
+        for item, options in self._dirty.items():
+            if options:
+                args = [ ]
+                for name, value in options.items():
+                    args += [ "-" + name, value ]
+                batch += [ item, tuple(args) ]
+                self._shown.setdefault(item, { }).update(options)
+        self._dirty.clear()
+        if batch:
+            self._canvas.tk.call(APPLY_COMMAND, self._canvas._w, tuple(batch))
+            n = len(batch) // 2
+            self.frames += 1
+            self.items += n
+            self.last_frame_items = n
+            for fn in self._frame_listeners:
+                fn(n)
+
+    def add_frame_listener(self, fn):
+        self._frame_listeners.append(fn)
+
+
 class WordleSquare:
 
-    def __init__(self, canvas, row, col):
-        x0 = (CANVAS_WIDTH - BOARD_WIDTH) / 2 + col * SQUARE_DELTA
+    def __init__(self, canvas, row, col, renderer, left=(CANVAS_WIDTH - BOARD_WIDTH) / 2):
+        x0 = left + col * SQUARE_DELTA
         y0 = TOP_MARGIN + row * SQUARE_DELTA
         x1 = x0 + SQUARE_SIZE
         y1 = y0 + SQUARE_SIZE
-        self._canvas = canvas
+        self._renderer = renderer
         self._ch = " "
         self._color = UNKNOWN_COLOR
         self._frame = canvas.create_rectangle(x0, y0, x1, y1)
@@ -294,13 +665,14 @@ class WordleSquare:
                                         y0 + SQUARE_SIZE / 2,
                                         text=self._ch,
                                         font=SQUARE_FONT)
+        renderer.track(self._text, text=self._ch)
 
     def get_letter(self):
         return self._ch
 
     def set_letter(self, ch):
         self._ch = ch
-        self._canvas.itemconfigure(self._text, text=ch)
+        self._renderer.configure(self._text, text=ch)
 
     def get_color(self):
         return self._color
@@ -311,20 +683,21 @@ class WordleSquare:
         fg = "White"
         if color == UNKNOWN_COLOR:
             fg = "Black"
-        self._canvas.itemconfig(self._frame, fill=color)
-        self._canvas.itemconfig(self._text, fill=fg)
+        self._renderer.configure(self._frame, fill=color)
+        self._renderer.configure(self._text, fill=fg)
 
 
 class WordleKey:
 
-    def __init__(self, canvas, x, y, width, height, label):
-        self._canvas = canvas
+    def __init__(self, canvas, x, y, width, height, label, renderer, scale=1.0):
+        self._renderer = renderer
         self._label = label
         self._bounds = [ x, y, width, height ]
         self._color = UNKNOWN_COLOR
         font = KEY_FONT
         if label == "ENTER":
             font = ENTER_FONT
+        font = (font[0], round(font[1] * scale)) + font[2:]
         if label == "DELETE":
             label = "\u232B"
         points = [ x + KEY_CORNER, y,
@@ -355,6 +728,7 @@ class WordleKey:
                                         y + height / 2,
                                         text=label,
                                         font=font)
+        renderer.track(self._frame, fill=KEY_COLOR)
 
     def get_color(self):
         return self._color
@@ -364,23 +738,24 @@ class WordleKey:
         fg = "White"
         if color == UNKNOWN_COLOR:
             fg = "Black"
-        self._canvas.itemconfig(self._frame, fill=color)
-        self._canvas.itemconfig(self._text, fill=fg)
+        self._renderer.configure(self._frame, fill=color)
+        self._renderer.configure(self._text, fill=fg)
 
 
 class WordleMessage:
 
-    def __init__(self, canvas, x, y):
-        self._canvas = canvas
+    def __init__(self, canvas, x, y, renderer, font=MESSAGE_FONT):
+        self._renderer = renderer
         self._text = ""
         self._msg = canvas.create_text(x, y,
                                        text="",
-                                       font=MESSAGE_FONT,
+                                       font=font,
                                        anchor=tk.CENTER)
+        renderer.track(self._msg, text="", fill="Black")
 
     def get_text(self):
         return self._text
 
     def set_text(self, text, color="Black"):
         self._text = text
-        self._canvas.itemconfigure(self._msg, text=text, fill=color)
+        self._renderer.configure(self._msg, text=text, fill=color)
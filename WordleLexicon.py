@@ -0,0 +1,195 @@
+# File: WordleLexicon.py
+
+"""
+This module defines the Lexicon class, which wraps a word list with
+constant-time membership tests, a packed integer encoding of each word
+and bitset indexes over the letters in each position.
+"""
+
+import hashlib
+from array import array
+
+import WordleDictionary
+
+# Constants
+
+N_LETTERS = 26                  # Letters in the alphabet
+LETTER_BITS = 5                 # Bits used to encode one letter
+LETTER_MASK = (1 << LETTER_BITS) - 1
+MAX_WORD_LENGTH = 10            # Longest words whose feedback fits in 16 bits
+
+_shared = { }                   # Lexicons by content hash
+
+def content_hash(words):
+    """Returns a hex digest of a word list, used to key caches."""
+    return hashlib.sha256("\n".join(words).encode("ascii")).hexdigest()
+
+class Lexicon:
+    """
+    This class indexes a list of lowercase words of equal length.
+
+    Each word has an id, which is its position in the list.  The
+    packed code for a word stores letter i (a = 0 ... z = 25) in bits
+    5 * i through 5 * i + 4, so five-letter words fit in 25 bits.  The
+    codes are stored as uint32 for words of up to six letters and as
+    uint64 for longer words.
+    The bitset indexes are Python integers in which bit k is set when
+    word k has the property in question.
+    """
+
+    def __init__(self, words):
+        """Creates a lexicon from a sequence of lowercase words."""
+        words = list(words)
+        if len(words) == 0:
+            raise ValueError("A lexicon needs at least one word")
+        length = len(words[0])
+        if length < 1 or length > MAX_WORD_LENGTH:
+            raise ValueError(f"Words must have 1 to {MAX_WORD_LENGTH} letters")
+        self._words = words
+        self._length = length
+        self._ids = { }
+        self._codes = array("I" if LETTER_BITS * length <= 32 else "Q")
+        position_bits = [ [ 0 ] * N_LETTERS for _ in range(length) ]
+        count_bits = [ [ 0 ] * length for _ in range(N_LETTERS) ]
+        for k, word in enumerate(words):
+            if len(word) != length:
+                raise ValueError(f"Word '{word}' is not {length} letters long")
+            self._ids.setdefault(word, k)
+            code = 0
+            seen = { }
+            for i, ch in enumerate(word):
+                letter = ord(ch) - ord("a")
+                if letter < 0 or letter >= N_LETTERS:
+                    raise ValueError(f"Word '{word}' is not lowercase a-z")
+                code |= letter << (LETTER_BITS * i)
+                position_bits[i][letter] |= 1 << k
+                n = seen.get(letter, 0)
+                count_bits[letter][n] |= 1 << k
+                seen[letter] = n + 1
+            self._codes.append(code)
+        self._position_masks = position_bits
+        self._count_masks = count_bits
+        self._all_mask = (1 << len(words)) - 1
+        self._content_hash = None
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word):
+        return word in self._ids
+
+    def __iter__(self):
+        return iter(self._words)
+
+    @property
+    def length(self):
+        """The number of letters in every word."""
+        return self._length
+
+    @property
+    def words(self):
+        return self._words
+
+    @property
+    def codes(self):
+        """The packed code of every word, as an array of uint32 or uint64."""
+        return self._codes
+
+    @property
+    def content_hash(self):
+        """A hex digest of the word list, used to key on-disk caches."""
+        if self._content_hash is None:
+            self._content_hash = content_hash(self._words)
+        return self._content_hash
+
+    @property
+    def all_mask(self):
+        """The bitset containing every word id."""
+        return self._all_mask
+
+    def index(self, word):
+        """Returns the id of word, or -1 if it is not in the lexicon."""
+        return self._ids.get(word, -1)
+
+    def word(self, k):
+        return self._words[k]
+
+    def encode(self, word):
+        """Returns the packed code for an arbitrary lowercase word."""
+        code = 0
+        for i, ch in enumerate(word):
+            code |= (ord(ch) - ord("a")) << (LETTER_BITS * i)
+        return code
+
+    def decode(self, code):
+        """Returns the word for a packed code."""
+        return "".join(chr(ord("a") + ((code >> (LETTER_BITS * i)) & LETTER_MASK))
+                       for i in range(self._length))
+
+    def position_mask(self, i, ch):
+        """Returns the bitset of words that have ch in position i."""
+        return self._position_masks[i][ord(ch) - ord("a")]
+
+    def letter_mask(self, ch):
+        """Returns the bitset of words that contain ch anywhere."""
+        return self._count_masks[ord(ch) - ord("a")][0]
+
+    def count_mask(self, ch, n):
+        """Returns the bitset of words that contain ch at least n times."""
+        if n <= 0:
+            return self._all_mask
+        if n > self._length:
+            return 0
+        return self._count_masks[ord(ch) - ord("a")][n - 1]
+
+    def mask(self, ids):
+        """Returns the bitset of the word ids in ids."""
+        bits = bytearray((len(self._words) + 7) // 8)
+        for k in ids:
+            bits[k >> 3] |= 1 << (k & 7)
+        return int.from_bytes(bits, "little")
+
+    def ids(self, mask):
+        """Returns the word ids in a bitset, in increasing order."""
+        result = [ ]
+        while mask:
+            low = mask & -mask
+            result.append(low.bit_length() - 1)
+            mask ^= low
+        return result
+
+    def is_valid(self, s):
+        """Returns True if s, in any case, is a word in the lexicon."""
+        return s.lower() in self._ids
+
+
+def shared_lexicon(words, digest=None):
+    """
+    Returns a Lexicon for words, reusing the one already built for any
+    list with the same content hash.  Callers that have computed the
+    hash may pass it as digest.
+    """
+    words = list(words)
+    if digest is None:
+        digest = content_hash(words)
+    lexicon = _shared.get(digest)
+    if lexicon is None:
+        lexicon = Lexicon(words)
+        _shared[digest] = lexicon
+    return lexicon
+
+def find_shared_lexicon(digest):
+    """Returns the shared Lexicon with the given content hash, or None."""
+    return _shared.get(digest)
+
+def shared_count():
+    """Returns the number of distinct shared lexicons built so far."""
+    return len(_shared)
+
+def __getattr__(name):
+    # LEXICON is built from the default dictionary the first time it is used
+    if name == "LEXICON":
+        lexicon = shared_lexicon(WordleDictionary.FIVE_LETTER_WORDS)
+        globals()[name] = lexicon
+        return lexicon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
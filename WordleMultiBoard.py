@@ -0,0 +1,242 @@
+# File: WordleMultiBoard.py
+
+"""
+This module implements multi-board Wordle, in the style of Quordle
+and Octordle, in which every guess is played against several hidden
+answers at once.  Each guess is scored against all of the boards in
+one vectorized call, and the solver ranks guesses by the information
+they are expected to reveal summed over the unsolved boards.
+"""
+
+import numpy as np
+
+import WordleLexicon
+from WordleEngine import n_patterns, solved_code
+from WordleFeedback import get_matrix, score_many
+from WordleSolver import (ENTROPY, EXACT_LIMIT, HISTOGRAM_CELLS, SAMPLE_SIZE,
+                          SHORTLIST_SIZE, STRATEGIES, guess_costs)
+
+# Constants
+
+BOARD_COUNTS = (4, 8, 16)
+EXTRA_ROWS = 5                  # Rows allowed beyond one per board
+
+def score_boards(guess, answers, lexicon=None):
+    """
+    Returns the feedback codes for guess against every answer id in
+    answers, as one array with an entry per board.
+    """
+    if lexicon is None:
+        lexicon = WordleLexicon.LEXICON
+    return score_many(guess, np.asarray(answers, dtype=np.intp), lexicon)
+
+def default_rows(n_boards):
+    """Returns the usual number of rows for a game with n_boards boards."""
+    return n_boards + EXTRA_ROWS
+
+
+class MultiBoardGame:
+    """This class tracks one game played against several answers at once."""
+
+    def __init__(self, answers, lexicon=None, n_rows=None):
+        """
+        Creates a game against the answer ids in answers, which must
+        name one of the BOARD_COUNTS numbers of boards.
+        """
+        if lexicon is None:
+            lexicon = WordleLexicon.LEXICON
+        if len(answers) not in BOARD_COUNTS:
+            raise ValueError(f"A game cannot have {len(answers)} boards")
+        self._lexicon = lexicon
+        self._answers = np.asarray(answers, dtype=np.intp)
+        if n_rows is None:
+            n_rows = default_rows(len(self._answers))
+        self._n_rows = n_rows
+        self._solved_code = solved_code(lexicon.length)
+        self._solved = np.zeros(len(self._answers), dtype=bool)
+        self._guesses = [ ]
+        self._feedback = [ ]
+
+    @property
+    def lexicon(self):
+        return self._lexicon
+
+    @property
+    def n_boards(self):
+        return len(self._answers)
+
+    @property
+    def n_rows(self):
+        return self._n_rows
+
+    @property
+    def answers(self):
+        return self._answers
+
+    @property
+    def row(self):
+        return len(self._guesses)
+
+    @property
+    def solved(self):
+        """A boolean array saying which boards have been solved."""
+        return self._solved.copy()
+
+    @property
+    def guesses(self):
+        """The list of guess ids played so far."""
+        return list(self._guesses)
+
+    @property
+    def feedback(self):
+        """The list of per-board code arrays, one for each guess."""
+        return list(self._feedback)
+
+    def is_won(self):
+        return bool(self._solved.all())
+
+    def is_over(self):
+        return self.is_won() or len(self._guesses) >= self._n_rows
+
+    def submit(self, s):
+        """
+        Scores the guess s against every board and returns the array of
+        codes.  Boards solved by an earlier guess report the solved code.
+        Raises ValueError if the game is over or s is not a word.
+        """
+        if self.is_over():
+            raise ValueError("The game is already over")
+        guess = self._lexicon.index(s.lower())
+        if guess < 0:
+            raise ValueError(f"'{s}' is not a valid word")
+        codes = score_boards(guess, self._answers, self._lexicon)
+        codes[self._solved] = self._solved_code
+        self._solved |= codes == self._solved_code
+        self._guesses.append(guess)
+        self._feedback.append(codes)
+        return codes
+
+
+class MultiBoardSolver:
+    """
+    This class keeps one candidate set per board and suggests guesses
+    for all of the boards jointly.  A guess's cost is the sum of its
+    single-board costs over the unsolved boards, and every board's
+    histograms come out of a single bincount.  As in Solver, large
+    candidate sets are ranked against a sample first and only a
+    shortlist is scored exactly.  When a board is down to one
+    candidate, that word is played at once.
+    """
+
+    def __init__(self, n_boards, lexicon=None, matrix=None,
+                 strategy=ENTROPY, answers=None):
+        if lexicon is None:
+            lexicon = WordleLexicon.LEXICON
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'")
+        if matrix is None:
+            matrix = get_matrix(lexicon)
+        self._n_boards = n_boards
+        self._lexicon = lexicon
+        self._matrix = matrix
+        self._strategy = strategy
+        self._n_patterns = n_patterns(lexicon.length)
+        self._solved_code = solved_code(lexicon.length)
+        self._all_guesses = np.arange(len(lexicon))
+        if answers is None:
+            answers = self._all_guesses
+        self._answers = np.unique(np.asarray(answers, dtype=np.intp))
+        self.reset()
+
+    def reset(self):
+        self._candidates = [ self._answers ] * self._n_boards
+        self._solved = np.zeros(self._n_boards, dtype=bool)
+
+    @property
+    def candidates(self):
+        """The list of candidate id arrays, one per board."""
+        return list(self._candidates)
+
+    def update(self, guess, codes):
+        """Narrows every unsolved board using its code for guess."""
+        row = self._matrix[guess]
+        for board in range(self._n_boards):
+            if self._solved[board]:
+                continue
+            if codes[board] == self._solved_code:
+                self._solved[board] = True
+                self._candidates[board] = np.array([ guess ], dtype=np.intp)
+            else:
+                cands = self._candidates[board]
+                self._candidates[board] = cands[row[cands] == codes[board]]
+
+    def _costs(self, guesses, cand_lists):
+        """
+        Returns the summed cost of each guess over a list of candidate
+        arrays, one per board.  The board number is folded into the
+        histogram bin, so every board is counted by the same bincount.
+        """
+        cands = np.concatenate(cand_lists)
+        offsets = np.concatenate([ np.full(len(c), i)
+                                   for i, c in enumerate(cand_lists) ])
+        width = len(cand_lists) * self._n_patterns
+        offsets = (offsets * self._n_patterns).astype(np.int32)
+        block = max(1, HISTOGRAM_CELLS // width)
+        costs = np.empty(len(guesses))
+        for start in range(0, len(guesses), block):
+            chunk = guesses[start:start + block]
+            codes = np.asarray(self._matrix[np.ix_(chunk, cands)], dtype=np.int32)
+            codes += offsets[None, :]
+            codes += (np.arange(len(chunk), dtype=np.int32) * width)[:, None]
+            hist = np.bincount(codes.ravel(), minlength=len(chunk) * width)
+            hist = hist.reshape(len(chunk) * len(cand_lists), self._n_patterns)
+            per_board = guess_costs(hist, self._strategy)
+            costs[start:start + block] = per_board.reshape(len(chunk), -1).sum(axis=1)
+        return costs
+
+    def best_guess(self):
+        """Returns the id of the best next guess, or -1 if none remain."""
+        boards = [ b for b in range(self._n_boards) if not self._solved[b] ]
+        if len(boards) == 0:
+            return -1
+        if any(len(self._candidates[b]) == 0 for b in boards):
+            return -1
+        for b in boards:
+            if len(self._candidates[b]) == 1:
+                return int(self._candidates[b][0])
+        cand_lists = [ self._candidates[b] for b in boards ]
+        guesses = self._all_guesses
+        if sum(len(c) for c in cand_lists) > EXACT_LIMIT:
+            per_board = max(1, SAMPLE_SIZE // len(boards))
+            sample = [ c[(np.arange(min(per_board, len(c)))
+                          * (len(c) / min(per_board, len(c)))).astype(np.intp)]
+                       for c in cand_lists ]
+            costs = self._costs(guesses, sample)
+            if len(guesses) > SHORTLIST_SIZE:
+                keep = np.argpartition(costs, SHORTLIST_SIZE)[:SHORTLIST_SIZE]
+                guesses = guesses[np.sort(keep)]
+        costs = self._costs(guesses, cand_lists)
+        open_cands = np.concatenate([ self._candidates[b] for b in boards ])
+        is_candidate = np.isin(guesses, open_cands)
+        order = np.lexsort((guesses, ~is_candidate, np.round(costs, 9)))
+        return int(guesses[order[0]])
+
+    def play(self, answers, max_rows=None):
+        """
+        Plays a game against the answer ids and returns the list of
+        guess ids.  The solver is reset first.
+        """
+        answers = np.asarray(answers, dtype=np.intp)
+        if max_rows is None:
+            max_rows = default_rows(len(answers))
+        self.reset()
+        guesses = [ ]
+        while len(guesses) < max_rows:
+            guess = self.best_guess()
+            if guess < 0:
+                break
+            guesses.append(guess)
+            self.update(guess, np.asarray(self._matrix[guess, answers]))
+            if self._solved.all():
+                break
+        return guesses
@@ -0,0 +1,141 @@
+# File: WordleOpenings.py
+
+"""
+This module stores an opening book for the Wordle solver: the best
+first guess for a lexicon and the best second guess for every
+feedback pattern that first guess can produce.  The book depends only
+on the lexicon and the strategy, so it is computed once offline and
+saved to a small file that the solver loads the first time it needs it.
+
+Running this file as a program builds the books for the default
+lexicon and every strategy.
+"""
+
+import hashlib
+import os
+import struct
+from array import array
+
+import numpy as np
+
+from WordlePaths import cache_dir
+
+# Constants
+
+BOOK_VERSION = 1                # Bump when the file layout changes
+BOOK_MAGIC = b"WOBK"
+NO_GUESS = 0xFFFF               # Follow-up for patterns that cannot occur
+HEADER = struct.Struct("<4sHHH")  # Magic, version, opener, pattern count
+
+_books = { }
+
+class OpeningBook:
+    """This class holds an opener id and one follow-up id per pattern."""
+
+    def __init__(self, opener, followups):
+        self._opener = opener
+        self._followups = array("H", followups)
+
+    @property
+    def opener(self):
+        return self._opener
+
+    def followup(self, code):
+        """Returns the second guess after pattern code, or -1 if none."""
+        k = self._followups[code]
+        if k == NO_GUESS:
+            return -1
+        return k
+
+    def save(self, path):
+        """Writes the book to path, replacing any existing file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, self._opener,
+                                len(self._followups)))
+            f.write(self._followups.tobytes())
+        os.replace(tmp, path)
+
+    @staticmethod
+    def read(path):
+        """Reads a book from path, or returns None if the file is unusable."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            return None
+        magic, version, opener, n = HEADER.unpack_from(data)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            return None
+        followups = array("H")
+        followups.frombytes(data[HEADER.size:HEADER.size + 2 * n])
+        if len(followups) != n:
+            return None
+        return OpeningBook(opener, followups)
+
+def cache_key(lexicon, answers=None):
+    """
+    Returns the part of a cache file name that identifies lexicon and,
+    when only some word ids may be answers, those ids.
+    """
+    key = lexicon.content_hash[:16]
+    if answers is not None and len(answers) != len(lexicon):
+        ids = np.ascontiguousarray(answers, dtype=np.int32).tobytes()
+        key += "-" + hashlib.blake2b(ids, digest_size=8).hexdigest()
+    return key
+
+def book_path(lexicon, strategy, directory=None, answers=None):
+    """
+    Returns the file name of the opening book for lexicon and strategy.
+    When only some word ids may be answers, a digest of those ids is
+    part of the name.
+    """
+    if directory is None:
+        directory = cache_dir()
+    name = f"openings-v{BOOK_VERSION}-{strategy}-{cache_key(lexicon, answers)}.bin"
+    return os.path.join(directory, name)
+
+def load_book(lexicon, strategy, directory=None, answers=None):
+    """
+    Returns the opening book for lexicon, strategy and answer ids, or
+    None if it has not been built.  Books are read at most once per
+    process.
+    """
+    path = book_path(lexicon, strategy, directory, answers)
+    if path not in _books:
+        book = None
+        if os.path.exists(path):
+            book = OpeningBook.read(path)
+        _books[path] = book
+    return _books[path]
+
+def build_book(solver, directory=None):
+    """
+    Computes the opening book for the solver's lexicon and strategy with
+    exact ranking, saves it and returns it.  The solver is left reset.
+    """
+    lexicon = solver.lexicon
+    solver.reset()
+    opener = solver.best_guess(exact=True)
+    n_patterns = solver.n_patterns
+    followups = array("H", [ NO_GUESS ]) * n_patterns
+    row = solver.matrix[opener][solver.answers]
+    for code in sorted(set(int(c) for c in row)):
+        if code == solver.solved_code:
+            continue
+        solver.reset()
+        solver.update(opener, code)
+        followups[code] = solver.best_guess(exact=True)
+    solver.reset()
+    book = OpeningBook(opener, followups)
+    path = book_path(lexicon, solver.strategy, directory, solver.answers)
+    book.save(path)
+    _books[path] = book
+    return book
+
+if __name__ == "__main__":
+    from WordleLexicon import LEXICON
+    from WordleSolver import STRATEGIES, Solver
+    for strategy in STRATEGIES:
+        book = build_book(Solver(LEXICON, strategy=strategy, use_book=False))
+        print(f"{strategy}: {LEXICON.word(book.opener)}")
@@ -0,0 +1,46 @@
+# File: WordlePaths.py
+
+"""
+This module names the directories in which the Wordle programs keep
+their files, without importing anything heavier than os.
+"""
+
+import os
+
+# Constants
+
+CACHE_ENV = "WORDLE_CACHE_DIR"  # Environment override for the cache
+DATA_ENV = "WORDLE_DATA_DIR"    # Environment override for the data directory
+
+def cache_dir():
+    """
+    Returns the directory that holds cached matrices and indexes.  By
+    default this is the cache directory next to the program, or the
+    user's cache directory if that one cannot be written, as on a
+    read-only install.
+    """
+    path = os.environ.get(CACHE_ENV)
+    if not path:
+        home = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(home, "cache")
+        writable = path if os.path.isdir(path) else home
+        if not os.access(writable, os.W_OK):
+            base = os.environ.get("XDG_CACHE_HOME")
+            if not base:
+                base = os.path.join(os.path.expanduser("~"), ".cache")
+            path = os.path.join(base, "wordle")
+    return path
+
+def data_dir():
+    """
+    Returns the directory that holds game logs and statistics.  Unlike
+    the cache, its files cannot be rebuilt, so by default it is kept in
+    the user's data directory rather than next to the program.
+    """
+    path = os.environ.get(DATA_ENV)
+    if not path:
+        base = os.environ.get("XDG_DATA_HOME")
+        if not base:
+            base = os.path.join(os.path.expanduser("~"), ".local", "share")
+        path = os.path.join(base, "wordle")
+    return path
@@ -0,0 +1,182 @@
+# File: WordleRegistry.py
+
+"""
+This module keeps a registry of named Wordle dictionaries, such as
+one per locale or per tenant.  Each dictionary has a list of answers
+and a (usually larger) list of allowed guesses, both loaded from
+files the first time the dictionary is used.
+
+Lists of allowed words are indexed into Lexicon objects only once per
+process: lexicons are shared by the content hash of their words, so
+every dictionary and session that uses the same list, including the
+default LEXICON, shares one lexicon.  Answer lists are only looked
+up in the allowed lexicon, so they are read but never indexed.
+"""
+
+import os
+import random
+
+import numpy as np
+
+from WordleDictionary import WORD_FILE, load_words
+from WordleLexicon import content_hash, find_shared_lexicon, shared_lexicon
+
+# Constants
+
+DEFAULT_DICTIONARY = "en"
+
+_file_hashes = { }              # Content hashes by (path, mtime, size)
+
+def read_word_file(path):
+    """
+    Returns the words in a file.  Files ending in .bin are packed word
+    files; any other file has one word per line, and blank lines and
+    lines starting with # are ignored.
+    """
+    if path.endswith(".bin"):
+        return list(load_words(path))
+    words = [ ]
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            word = line.strip().lower()
+            if word and not word.startswith("#"):
+                words.append(word)
+    return words
+
+def load_lexicon(path):
+    """
+    Returns the shared Lexicon for the words in path.  A file that has
+    not changed since it was last read is not read again.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _file_hashes.get(key)
+    lexicon = None if digest is None else find_shared_lexicon(digest)
+    if lexicon is None:
+        words = read_word_file(path)
+        digest = content_hash(words)
+        _file_hashes[key] = digest
+        lexicon = shared_lexicon(words, digest)
+    return lexicon
+
+
+class Dictionary:
+    """
+    This class pairs the lexicon of allowed guesses with the subset of
+    it that may be chosen as answers, given as a list of words.
+    Answers are identified by their ids in the allowed lexicon.
+    """
+
+    def __init__(self, name, allowed, answers=None):
+        self._name = name
+        self._allowed = allowed
+        if answers is None or answers is allowed:
+            ids = np.arange(len(allowed))
+        else:
+            answers = list(answers)
+            ids = np.array([ allowed.index(word) for word in answers ],
+                           dtype=np.intp)
+            if len(ids) > 0 and ids.min() < 0:
+                missing = answers[int(np.argmin(ids))]
+                raise ValueError(f"Answer '{missing}' is not an allowed guess")
+        ids.flags.writeable = False
+        self._answer_ids = ids
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def allowed(self):
+        """The Lexicon of words that may be guessed."""
+        return self._allowed
+
+    @property
+    def answer_ids(self):
+        """
+        The ids, in the allowed lexicon, of the possible answers, in the
+        order of the answer list.
+        """
+        return self._answer_ids
+
+    @property
+    def length(self):
+        return self._allowed.length
+
+    def is_valid(self, s):
+        return self._allowed.is_valid(s)
+
+    def random_answer(self, rng=random):
+        """Returns the id of an answer chosen uniformly at random."""
+        return int(self._answer_ids[rng.randrange(len(self._answer_ids))])
+
+
+class DictionaryRegistry:
+    """
+    This class maps dictionary names to the files that hold their word
+    lists.  Dictionaries are loaded when first requested and kept.
+    Every registered name also has a small integer index, which lets
+    compact session records refer to a dictionary in two bytes.
+    """
+
+    def __init__(self):
+        self._sources = { }
+        self._dictionaries = { }
+        self._names = [ ]
+
+    def register(self, name, allowed, answers=None):
+        """
+        Registers a dictionary whose allowed guesses are in the file
+        allowed and whose answers are in the file answers (by default,
+        the same file).  Registering a name again replaces it.
+        """
+        if name not in self._sources:
+            self._names.append(name)
+        self._sources[name] = (allowed, answers)
+        self._dictionaries.pop(name, None)
+
+    def names(self):
+        return list(self._names)
+
+    def sources(self):
+        """
+        Returns a list of (name, allowed, answers) triples that can be
+        passed to register to rebuild this registry, for example in a
+        worker process.
+        """
+        return [ (name,) + self._sources[name] for name in self._names ]
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def index(self, name):
+        """Returns the small integer index of a registered name."""
+        if name not in self._sources:
+            raise ValueError(f"No dictionary named '{name}'")
+        return self._names.index(name)
+
+    def by_index(self, i):
+        return self.get(self._names[i])
+
+    def get(self, name=DEFAULT_DICTIONARY):
+        """Returns the named Dictionary, loading its files if needed."""
+        dictionary = self._dictionaries.get(name)
+        if dictionary is None:
+            if name not in self._sources:
+                raise ValueError(f"No dictionary named '{name}'")
+            allowed_path, answers_path = self._sources[name]
+            allowed = load_lexicon(allowed_path)
+            answers = None
+            if answers_path is not None and answers_path != allowed_path:
+                answers = read_word_file(answers_path)
+            dictionary = Dictionary(name, allowed, answers)
+            self._dictionaries[name] = dictionary
+        return dictionary
+
+
+REGISTRY = DictionaryRegistry()
+REGISTRY.register(DEFAULT_DICTIONARY, WORD_FILE)
+
+def get_dictionary(name=DEFAULT_DICTIONARY):
+    """Returns a dictionary from the default registry."""
+    return REGISTRY.get(name)
@@ -0,0 +1,293 @@
+# File: WordleReplay.py
+
+"""
+This module keeps an append-only log of finished Wordle games and
+replays such logs to check them.
+
+A log file starts with a 40-byte header (the magic string WRPL, the
+format version, the word length, the number of rows and the SHA-256
+content hash of the lexicon) followed by one fixed-width record per
+game: the answer id, the number of rows played, and the guess ids
+and feedback codes of every row.  With six rows of five-letter words
+a record takes 21 bytes.  Records are buffered in memory and written
+in batches, and a record cut short by a crash is dropped the next
+time the log is opened for writing.
+
+Running this file as a program replays a log: the records are
+memory-mapped in chunks by a pool of worker processes, every row is
+scored again and compared with the logged feedback, and the totals
+are printed.  No process holds more than one chunk at a time.
+
+Usage: python -m WordleReplay LOG [--words FILE] [--workers N]
+                                  [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from WordleEngine import DEFAULT_ROWS, feedback_typecode, solved_code
+from WordleFeedback import score_pairs
+from WordlePaths import data_dir
+from WordleRegistry import REGISTRY, load_lexicon
+
+# Constants
+
+LOG_VERSION = 1                 # Bump when the file layout changes
+LOG_MAGIC = b"WRPL"
+HEADER = struct.Struct("<4sHBB32s")  # Magic, version, length, rows, hash
+FLUSH_RECORDS = 256             # Records buffered before a write
+CHUNK_RECORDS = 1 << 16         # Records replayed by a worker at a time
+MAX_REPORTED = 16               # Mismatched records listed by replay
+
+_lexicon = None                 # The lexicon owned by a replay worker
+
+def record_dtype(length, n_rows=DEFAULT_ROWS):
+    """Returns the NumPy dtype of one game record."""
+    code = "<" + feedback_typecode(length)
+    return np.dtype([ ("answer", "<u2"), ("rows", "u1"),
+                      ("guesses", "<u2", (n_rows,)),
+                      ("codes", code, (n_rows,)) ])
+
+def default_log_path(lexicon, directory=None):
+    """Returns the file name of the game log for lexicon."""
+    if directory is None:
+        directory = data_dir()
+    name = f"games-v{LOG_VERSION}-{lexicon.content_hash[:16]}.wrl"
+    return os.path.join(directory, name)
+
+def read_header(path):
+    """
+    Returns the (length, n_rows, content hash) triple stored in the
+    header of a log, or raises ValueError if path is not a log.
+    """
+    with open(path, "rb") as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a game log")
+    magic, version, length, n_rows, digest = HEADER.unpack(data)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError(f"{path} is not a version {LOG_VERSION} game log")
+    return length, n_rows, digest.hex()
+
+def open_log(path):
+    """
+    Returns a read-only array of the records in a log.  The records
+    are memory-mapped, so slicing the array reads only that slice.
+    """
+    length, n_rows, _ = read_header(path)
+    dtype = record_dtype(length, n_rows)
+    n = (os.path.getsize(path) - HEADER.size) // dtype.itemsize
+    if n == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER.size,
+                     shape=(n,))
+
+
+class ReplayWriter:
+    """
+    This class appends game records to a log.  Records are collected
+    in a fixed-size buffer and written when it fills, when flush is
+    called and when the writer is closed.
+    """
+
+    def __init__(self, path, lexicon, n_rows=DEFAULT_ROWS,
+                 flush_every=FLUSH_RECORDS):
+        self._path = path
+        self._n_rows = n_rows
+        self._buffer = np.zeros(flush_every, dtype=record_dtype(lexicon.length, n_rows))
+        self._pending = 0
+        header = HEADER.pack(LOG_MAGIC, LOG_VERSION, lexicon.length, n_rows,
+                             bytes.fromhex(lexicon.content_hash))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "ab")
+        try:
+            self._check(header)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _check(self, header):
+        """Writes the header to a new log or checks that of an old one."""
+        size = self._file.seek(0, os.SEEK_END)
+        if size == 0:
+            self._file.write(header)
+            self._file.flush()
+            return
+        with open(self._path, "rb") as f:
+            if f.read(HEADER.size) != header:
+                raise ValueError(f"{self._path} is a log for another lexicon")
+        extra = (size - HEADER.size) % self._buffer.itemsize
+        if extra != 0:
+            self._file.truncate(size - extra)
+
+    @property
+    def path(self):
+        return self._path
+
+    def append(self, answer, guesses, codes):
+        """Adds the record of a game with the given ids and codes."""
+        n = len(guesses)
+        if n > self._n_rows or len(codes) != n:
+            raise ValueError("A game record needs one code per guess")
+        k = self._pending
+        buffer = self._buffer
+        buffer["answer"][k] = answer
+        buffer["rows"][k] = n
+        buffer["guesses"][k] = 0
+        buffer["guesses"][k, :n] = guesses
+        buffer["codes"][k] = 0
+        buffer["codes"][k, :n] = codes
+        self._pending += 1
+        if self._pending == len(self._buffer):
+            self.flush()
+
+    def flush(self):
+        """Writes every buffered record to the file."""
+        if self._pending > 0:
+            self._file.write(self._buffer[:self._pending].tobytes())
+            self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _init_worker(word_path):
+    global _lexicon
+    _lexicon = load_lexicon(word_path)
+
+def _replay_chunk(path, start, stop):
+    """
+    Replays records start through stop - 1 of a log and returns a dict
+    of totals for them.
+    """
+    records = np.array(open_log(path)[start:stop])
+    n_words = len(_lexicon)
+    solved = solved_code(_lexicon.length)
+    n_rows = records.dtype["guesses"].shape[0]
+    rows = records["rows"].astype(np.intp)
+    played = np.arange(n_rows)[None, :] < rows[:, None]
+    guesses = records["guesses"]
+    codes = records["codes"]
+    answers = np.broadcast_to(records["answer"][:, None], guesses.shape)
+    bad = (rows > n_rows) | (records["answer"] >= n_words)
+    bad |= ((guesses >= n_words) & played).any(axis=1)
+    wins = played & (codes == solved)
+    first_win = np.where(wins.any(axis=1), wins.argmax(axis=1) + 1, 0)
+    bad |= (first_win > 0) & (first_win != rows)
+    check = played & ~bad[:, None]
+    expected = score_pairs(guesses[check], answers[check], _lexicon)
+    wrong = np.zeros(guesses.shape, dtype=bool)
+    wrong[check] = expected != codes[check]
+    mismatched = wrong.any(axis=1)
+    ok = ~bad & ~mismatched
+    won = ok & (first_win > 0)
+    return {
+        "games": len(records),
+        "invalid": int(bad.sum()),
+        "mismatched_games": int(mismatched.sum()),
+        "mismatched_rows": int(wrong.sum()),
+        "mismatches": [ start + int(k) for k in np.flatnonzero(bad | mismatched)[:MAX_REPORTED] ],
+        "distribution": np.bincount(first_win[won], minlength=n_rows + 1).tolist(),
+        "losses": int((ok & (first_win == 0) & (rows == n_rows)).sum()),
+        "abandoned": int((ok & (first_win == 0) & (rows < n_rows)).sum()),
+    }
+
+def find_word_file(digest):
+    """
+    Returns the allowed-word file of a registered dictionary whose
+    lexicon has the given content hash, or None if there is none.
+    """
+    for name, allowed, _ in REGISTRY.sources():
+        if REGISTRY.get(name).allowed.content_hash == digest:
+            return allowed
+    return None
+
+def replay(path, word_path=None, workers=None, chunk_records=CHUNK_RECORDS):
+    """
+    Replays every record in the log at path against the lexicon in
+    word_path (by default, the registered dictionary the log was
+    written with) and returns a dict of totals.
+    """
+    length, n_rows, digest = read_header(path)
+    if word_path is None:
+        word_path = find_word_file(digest)
+        if word_path is None:
+            raise ValueError(f"No registered dictionary matches {path}")
+    lexicon = load_lexicon(word_path)
+    if lexicon.content_hash != digest:
+        raise ValueError(f"{word_path} is not the lexicon {path} was written with")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n = len(open_log(path))
+    totals = {
+        "games": 0, "invalid": 0, "mismatched_games": 0,
+        "mismatched_rows": 0, "mismatches": [ ],
+        "distribution": [ 0 ] * (n_rows + 1), "losses": 0, "abandoned": 0,
+    }
+    starts = range(0, n, chunk_records)
+    stops = [ min(start + chunk_records, n) for start in starts ]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(word_path,)) as pool:
+        for part in pool.map(_replay_chunk, [ path ] * len(starts), starts, stops):
+            for key, value in part.items():
+                if key == "distribution":
+                    for i, count in enumerate(value):
+                        totals[key][i] += count
+                elif key == "mismatches":
+                    room = MAX_REPORTED - len(totals[key])
+                    totals[key].extend(value[:room])
+                else:
+                    totals[key] += value
+    wins = sum(totals["distribution"][1:])
+    totals["wins"] = wins
+    totals["mean_guesses"] = None
+    if wins > 0:
+        totals["mean_guesses"] = sum(i * count for i, count
+                                     in enumerate(totals["distribution"])) / wins
+    return totals
+
+def print_results(results):
+    print(f"{results['games']} games, {results['wins']} wins, "
+          f"{results['losses']} losses, {results['abandoned']} abandoned")
+    if results["mean_guesses"] is not None:
+        print(f"Mean guesses {results['mean_guesses']:.3f}")
+    for n, count in enumerate(results["distribution"][1:], 1):
+        print(f"  {n}: {count}")
+    print(f"Invalid records: {results['invalid']}")
+    print(f"Feedback mismatches: {results['mismatched_rows']} rows "
+          f"in {results['mismatched_games']} games")
+    if results["mismatches"]:
+        print("First bad records: "
+              + ", ".join(str(k) for k in results["mismatches"]))
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay and check a Wordle game log")
+    parser.add_argument("log")
+    parser.add_argument("--words", help="the word file the log was written with")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-records", type=int, default=CHUNK_RECORDS)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+    results = replay(args.log, args.words, args.workers, args.chunk_records)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    return 1 if results["invalid"] or results["mismatched_games"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+# File: WordleSchedule.py
+
+"""
+This module chooses answers deterministically, so that every player
+and every server node that asks for the same puzzle gets the same
+word without storing or sharing a schedule.
+
+Puzzles are numbered from 0, and the daily puzzle for a date is the
+number of days since EPOCH.  The answers are played in cycles: within
+each cycle of len(answers) puzzles every answer appears exactly once,
+in an order given by a keyed permutation of the answer positions.
+The permutation is a small Feistel network, keyed by the seed, the
+tenant and the cycle number, whose domain is the smallest even power
+of two that covers the answers; positions that land outside the
+answers are mapped again ("cycle walking") until they land inside.
+Finding any puzzle's answer therefore takes a few hash evaluations.
+"""
+
+import datetime
+import hashlib
+
+# Constants
+
+EPOCH = datetime.date(2021, 6, 19)  # Date of puzzle 0
+ROUNDS = 4                      # Feistel rounds
+
+class FeistelPermutation:
+    """
+    This class is a keyed permutation of the integers 0 ... n - 1.
+    The same n and key always give the same permutation.
+    """
+
+    def __init__(self, n, key, rounds=ROUNDS):
+        if n <= 0:
+            raise ValueError("A permutation needs at least one element")
+        self._n = n
+        self._half_bits = max(1, ((n - 1).bit_length() + 1) // 2)
+        self._half_mask = (1 << self._half_bits) - 1
+        self._keys = [ hashlib.blake2b(key + bytes([ r ]), digest_size=16).digest()
+                       for r in range(rounds) ]
+
+    def __len__(self):
+        return self._n
+
+    def _round(self, r, x):
+        digest = hashlib.blake2b(x.to_bytes(8, "little"), key=self._keys[r],
+                                 digest_size=8).digest()
+        return int.from_bytes(digest, "little") & self._half_mask
+
+    def _encrypt(self, x):
+        bits = self._half_bits
+        left, right = x >> bits, x & self._half_mask
+        for r in range(len(self._keys)):
+            left, right = right, left ^ self._round(r, right)
+        return (left << bits) | right
+
+    def _decrypt(self, x):
+        bits = self._half_bits
+        left, right = x >> bits, x & self._half_mask
+        for r in reversed(range(len(self._keys))):
+            left, right = right ^ self._round(r, left), left
+        return (left << bits) | right
+
+    def permute(self, i):
+        """Returns the element that i is mapped to."""
+        if i < 0 or i >= self._n:
+            raise IndexError("permutation index out of range")
+        i = self._encrypt(i)
+        while i >= self._n:
+            i = self._encrypt(i)
+        return i
+
+    def inverse(self, j):
+        """Returns the element that is mapped to j."""
+        if j < 0 or j >= self._n:
+            raise IndexError("permutation index out of range")
+        j = self._decrypt(j)
+        while j >= self._n:
+            j = self._decrypt(j)
+        return j
+
+
+class AnswerScheduler:
+    """
+    This class maps puzzle numbers and dates to answer ids for one
+    list of answers, seed and tenant.  The permutation for a cycle is
+    built the first time that cycle is used.
+    """
+
+    def __init__(self, answers, seed=0, tenant=""):
+        self._answers = [ int(k) for k in answers ]
+        if len(self._answers) == 0:
+            raise ValueError("A schedule needs at least one answer")
+        self._prefix = f"{seed}\0{tenant}\0".encode("utf-8")
+        self._cycle = None
+        self._permutation = None
+
+    def _cycle_permutation(self, cycle):
+        if cycle != self._cycle:
+            key = self._prefix + str(cycle).encode("ascii")
+            self._permutation = FeistelPermutation(len(self._answers), key)
+            self._cycle = cycle
+        return self._permutation
+
+    def answer(self, puzzle):
+        """Returns the answer id for puzzle number puzzle."""
+        if puzzle < 0:
+            raise ValueError("Puzzle numbers start at 0")
+        cycle, position = divmod(puzzle, len(self._answers))
+        return self._answers[self._cycle_permutation(cycle).permute(position)]
+
+    def puzzle(self, answer, cycle=0):
+        """Returns the number of the puzzle in cycle whose answer is answer."""
+        position = self._answers.index(answer)
+        return (cycle * len(self._answers)
+                + self._cycle_permutation(cycle).inverse(position))
+
+    def daily_answer(self, date=None):
+        """Returns the answer id for the daily puzzle of date (see puzzle_number)."""
+        return self.answer(puzzle_number(date))
+
+def puzzle_number(date=None):
+    """
+    Returns the number of the daily puzzle for date (by default, today
+    in UTC, so that every time zone plays the same puzzle).
+    """
+    if date is None:
+        date = datetime.datetime.now(datetime.timezone.utc).date()
+    return (date - EPOCH).days
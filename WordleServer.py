@@ -0,0 +1,457 @@
+# File: WordleServer.py
+
+"""
+This program serves Wordle games over TCP.  Clients send one JSON
+object per line and receive one JSON object per line in reply.  Each
+game uses a dictionary from the registry, and every session that uses
+a dictionary shares its read-only lexicon.  A new game plays a random
+answer unless it asks for a puzzle number ("daily" for today's), whose
+answer every server with the same seed agrees on.  A session ends
+when its game is over, when it is closed or when its client
+disconnects, and its slot is then reused.  The reply to a
+guess lists only the keyboard keys whose state it changed.  Hint
+requests run in a pool of worker processes so that the event loop
+never blocks on the solver.  Every finished game is appended to the
+replay log of its lexicon and counted in that lexicon's statistics.
+A new game may instead ask for several boards, as in Quordle, whose
+guesses are scored against every board at once; such games are kept
+as objects outside the session stores and are not logged.
+
+Requests:
+    {"op": "new", "dictionary": name, "puzzle": n, "boards": n}
+    {"op": "guess", "session": id, "word": "crane"}
+    {"op": "hint", "session": id}
+    {"op": "close", "session": id}
+    {"op": "stats", "dictionary": name}
+
+Usage: python WordleServer.py [--host HOST] [--port PORT] [--log-dir DIR]
+                              [--seed SEED]
+                              [--dictionary NAME=ALLOWED[,ANSWERS]] ...
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from WordleEngine import DEFAULT_ROWS, decode, score, solved_code
+from WordleFeedback import get_matrix
+from WordleMultiBoard import BOARD_COUNTS, MultiBoardGame, MultiBoardSolver
+from WordleRegistry import DEFAULT_DICTIONARY, REGISTRY
+from WordleReplay import ReplayWriter, default_log_path
+from WordleSchedule import AnswerScheduler, puzzle_number
+from WordleSessions import SessionStore
+from WordleSolver import Solver
+from WordleStats import GameStats, default_stats_path
+
+# Constants
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8401
+LENGTH_BITS = 4                 # Low bits of a session id hold the word length
+LENGTH_MASK = (1 << LENGTH_BITS) - 1
+BOARDS_TAG = 0                  # Length bits of a multi-board session id
+FLUSH_INTERVAL = 5.0            # Seconds between flushes of the replay logs
+
+_solvers = { }                  # The solvers owned by a hint worker
+
+def _init_hint_worker(sources):
+    for name, allowed, answers in sources:
+        if name not in REGISTRY:
+            REGISTRY.register(name, allowed, answers)
+
+def _hint(name, history):
+    """
+    Replays a list of (guess id, code) pairs in the named dictionary
+    and returns the best guess.
+    """
+    solver = _solvers.get(name)
+    if solver is None:
+        dictionary = REGISTRY.get(name)
+        solver = Solver(dictionary.allowed, answers=dictionary.answer_ids)
+        _solvers[name] = solver
+    solver.reset()
+    for guess, code in history:
+        solver.update(guess, code)
+    return solver.best_guess()
+
+def _boards_hint(name, n_boards, history):
+    """
+    Runs in a hint worker: replays a multi-board game's history, given
+    as (guess id, list of codes) pairs, and returns the best guess.
+    """
+    key = (name, n_boards)
+    solver = _solvers.get(key)
+    if solver is None:
+        dictionary = REGISTRY.get(name)
+        solver = MultiBoardSolver(n_boards, dictionary.allowed,
+                                  answers=dictionary.answer_ids)
+        _solvers[key] = solver
+    solver.reset()
+    for guess, codes in history:
+        solver.update(guess, codes)
+    return solver.best_guess()
+
+def _puzzle_number(puzzle):
+    """Returns the puzzle number named in a request, or raises ValueError."""
+    if puzzle == "daily":
+        return puzzle_number()
+    if not isinstance(puzzle, int) or isinstance(puzzle, bool) or puzzle < 0:
+        raise ValueError(f"Invalid puzzle number {puzzle!r}")
+    return puzzle
+
+
+class WordleServer:
+    """This class hosts many concurrent games in one process."""
+
+    def __init__(self, registry=REGISTRY, n_rows=DEFAULT_ROWS, hint_workers=None,
+                 log_dir=None, seed=0):
+        self._registry = registry
+        self._seed = seed
+        self._schedulers = { }
+        self._n_rows = n_rows
+        self._stores = { }
+        self._boards = { }
+        self._board_ids = itertools.count(1)
+        self._log_dir = log_dir
+        self._logs = { }
+        self._stats = { }
+        self._hint_workers = hint_workers
+        self._pool = None
+        self._flusher = None
+
+    @property
+    def n_sessions(self):
+        return (sum(len(store) for store in self._stores.values())
+                + len(self._boards))
+
+    def _store(self, length):
+        """Returns the session store for games with words of length letters."""
+        store = self._stores.get(length)
+        if store is None:
+            store = SessionStore(self._n_rows, length)
+            self._stores[length] = store
+        return store
+
+    def _log(self, lexicon):
+        """Returns the replay log writer for games played with lexicon."""
+        path = default_log_path(lexicon, self._log_dir)
+        log = self._logs.get(path)
+        if log is None:
+            log = ReplayWriter(path, lexicon, self._n_rows)
+            self._logs[path] = log
+        return log
+
+    def _game_stats(self, lexicon):
+        """Returns the statistics for games played with lexicon."""
+        path = default_stats_path(lexicon, self._log_dir, "server")
+        stats = self._stats.get(path)
+        if stats is None:
+            stats = GameStats(lexicon, self._n_rows, path)
+            self._stats[path] = stats
+        return stats
+
+    def _split(self, session_id):
+        """Returns the store and store-level id named by a session id."""
+        store = self._stores.get(session_id & LENGTH_MASK)
+        if store is None:
+            raise ValueError(f"No session {session_id}")
+        return store, session_id >> LENGTH_BITS
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Builds the default dictionary's feedback matrix if needed and
+        starts listening.
+        """
+        loop = asyncio.get_running_loop()
+        default = self._registry.get(DEFAULT_DICTIONARY)
+        await loop.run_in_executor(None, get_matrix, default.allowed)
+        self._pool = ProcessPoolExecutor(max_workers=self._hint_workers,
+                                         initializer=_init_hint_worker,
+                                         initargs=(self._registry.sources(),))
+        self._flusher = loop.create_task(self._flush_logs())
+        return await asyncio.start_server(self._handle_client, host, port)
+
+    async def _flush_logs(self):
+        """
+        Writes out the buffered records of every replay log at regular
+        intervals, so a quiet server does not hold finished games back.
+        """
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            for log in self._logs.values():
+                log.flush()
+
+    def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        for log in self._logs.values():
+            log.close()
+        self._logs.clear()
+        for stats in self._stats.values():
+            stats.close()
+        self._stats.clear()
+
+    async def _handle_client(self, reader, writer):
+        sessions = set()
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("A request must be a JSON object")
+                    reply = await self.handle(request, sessions)
+                except (ValueError, KeyError, TypeError, OverflowError) as err:
+                    reply = { "ok": False, "error": str(err) }
+                writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for session_id in sessions:
+                self.release(session_id)
+            writer.close()
+
+    async def handle(self, request, sessions=None):
+        """
+        Returns the reply to one decoded request.  If sessions is a set,
+        it holds the ids of the live sessions started through it, which
+        the caller releases when the client goes away.
+        """
+        if sessions is None:
+            sessions = set()
+        op = request["op"]
+        if op == "new":
+            reply = self.new_game(request.get("dictionary", DEFAULT_DICTIONARY),
+                                  request.get("puzzle"), request.get("boards"))
+            sessions.add(reply["session"])
+            return reply
+        if op == "stats":
+            return self.stats(request.get("dictionary", DEFAULT_DICTIONARY))
+        session_id = request["session"]
+        if not isinstance(session_id, int) or isinstance(session_id, bool):
+            raise ValueError("A session id must be an integer")
+        if session_id & LENGTH_MASK == BOARDS_TAG:
+            return await self._handle_boards(op, session_id, request, sessions)
+        store, store_id = self._split(session_id)
+        session = store.get(store_id)
+        if op == "guess":
+            reply = self.guess(session, request["word"])
+            if reply["over"]:
+                store.release(store_id)
+                sessions.discard(session_id)
+            return reply
+        if op == "hint":
+            return await self.hint(session)
+        if op == "close":
+            store.release(store_id)
+            sessions.discard(session_id)
+            return { "ok": True }
+        raise ValueError(f"Unknown op '{op}'")
+
+    async def _handle_boards(self, op, session_id, request, sessions):
+        """Returns the reply to a request about a multi-board session."""
+        entry = self._boards.get(session_id)
+        if entry is None:
+            raise ValueError(f"No session {session_id}")
+        name, game = entry
+        if op == "guess":
+            reply = self.guess_boards(game, request["word"])
+            if reply["over"]:
+                self._boards.pop(session_id)
+                sessions.discard(session_id)
+            return reply
+        if op == "hint":
+            return await self.hint_boards(name, game)
+        if op == "close":
+            self._boards.pop(session_id)
+            sessions.discard(session_id)
+            return { "ok": True }
+        raise ValueError(f"Unknown op '{op}'")
+
+    def release(self, session_id):
+        """Ends a session if it is still live."""
+        if session_id & LENGTH_MASK == BOARDS_TAG:
+            self._boards.pop(session_id, None)
+            return
+        try:
+            store, store_id = self._split(session_id)
+            store.release(store_id)
+        except ValueError:
+            pass
+
+    def _scheduler(self, dictionary):
+        scheduler = self._schedulers.get(dictionary.name)
+        if scheduler is None:
+            scheduler = AnswerScheduler(dictionary.answer_ids, self._seed,
+                                        dictionary.name)
+            self._schedulers[dictionary.name] = scheduler
+        return scheduler
+
+    def new_game(self, name=DEFAULT_DICTIONARY, puzzle=None, boards=None):
+        """
+        Starts a game with a random answer, or with the answer for a
+        puzzle number or "daily" for today's puzzle.  If boards is one
+        of BOARD_COUNTS, the game has that many boards instead of one.
+        """
+        dictionary = self._registry.get(name)
+        if boards is not None and (boards != 1 or isinstance(boards, bool)):
+            return self._new_boards(dictionary, puzzle, boards)
+        if puzzle is None:
+            answer = dictionary.random_answer()
+        else:
+            puzzle = _puzzle_number(puzzle)
+            answer = self._scheduler(dictionary).answer(puzzle)
+        store_id = self._store(dictionary.length).allocate(
+            answer, self._registry.index(name))
+        session_id = (store_id << LENGTH_BITS) | dictionary.length
+        reply = { "ok": True, "session": session_id, "dictionary": name,
+                  "length": dictionary.length, "rows": self._n_rows }
+        if puzzle is not None:
+            reply["puzzle"] = puzzle
+        return reply
+
+    def _new_boards(self, dictionary, puzzle, n_boards):
+        """
+        Starts a multi-board game.  Numbered puzzle p plays the answers
+        of puzzles p * n_boards through p * n_boards + n_boards - 1.
+        """
+        if n_boards not in BOARD_COUNTS or isinstance(n_boards, bool):
+            raise ValueError(f"Invalid number of boards {n_boards!r}")
+        answer_ids = dictionary.answer_ids
+        if puzzle is None:
+            if n_boards > len(answer_ids):
+                raise ValueError(f"'{dictionary.name}' has too few answers")
+            answers = [ int(answer_ids[k])
+                        for k in random.sample(range(len(answer_ids)), n_boards) ]
+        else:
+            puzzle = _puzzle_number(puzzle)
+            scheduler = self._scheduler(dictionary)
+            answers = [ scheduler.answer(puzzle * n_boards + i)
+                        for i in range(n_boards) ]
+        game = MultiBoardGame(answers, dictionary.allowed)
+        session_id = (next(self._board_ids) << LENGTH_BITS) | BOARDS_TAG
+        self._boards[session_id] = (dictionary.name, game)
+        reply = { "ok": True, "session": session_id, "dictionary": dictionary.name,
+                  "length": dictionary.length, "rows": game.n_rows,
+                  "boards": n_boards }
+        if puzzle is not None:
+            reply["puzzle"] = puzzle
+        return reply
+
+    def is_over(self, session):
+        if session.row >= self._n_rows:
+            return True
+        dictionary = self._registry.by_index(session.dictionary)
+        return session.last_code() == solved_code(dictionary.length)
+
+    def guess(self, session, word):
+        if not isinstance(word, str):
+            raise ValueError("A guess must be a string")
+        if self.is_over(session):
+            raise ValueError("The game is already over")
+        lexicon = self._registry.by_index(session.dictionary).allowed
+        guess = lexicon.index(word.lower())
+        if guess < 0:
+            raise ValueError(f"'{word}' is not a valid word")
+        code = score(lexicon.word(guess), lexicon.word(session.answer))
+        session.add_row(guess, code)
+        keys = session.keyboard().update(lexicon.word(guess), code)
+        reply = { "ok": True, "row": session.row, "feedback": code,
+                  "states": decode(code, lexicon.length),
+                  "keys": dict(keys),
+                  "won": code == solved_code(lexicon.length),
+                  "over": self.is_over(session) }
+        if reply["over"]:
+            reply["answer"] = lexicon.word(session.answer)
+            rows = session.rows()
+            self._log(lexicon).append(session.answer, [ g for g, _ in rows ],
+                                      [ c for _, c in rows ])
+            self._game_stats(lexicon).record(session.answer,
+                                             session.row if reply["won"] else 0)
+        return reply
+
+    def guess_boards(self, game, word):
+        if not isinstance(word, str):
+            raise ValueError("A guess must be a string")
+        codes = game.submit(word)
+        length = game.lexicon.length
+        reply = { "ok": True, "row": game.row,
+                  "feedback": [ int(code) for code in codes ],
+                  "states": [ decode(int(code), length) for code in codes ],
+                  "solved": game.solved.tolist(),
+                  "won": game.is_won(), "over": game.is_over() }
+        if reply["over"]:
+            reply["answers"] = [ game.lexicon.word(k) for k in game.answers ]
+        return reply
+
+    def stats(self, name=DEFAULT_DICTIONARY):
+        stats = self._game_stats(self._registry.get(name).allowed)
+        return { "ok": True, "games": stats.games, "wins": stats.wins,
+                 "distribution": stats.distribution() }
+
+    async def hint(self, session):
+        if self.is_over(session):
+            raise ValueError("The game is already over")
+        dictionary = self._registry.by_index(session.dictionary)
+        loop = asyncio.get_running_loop()
+        guess = await loop.run_in_executor(self._pool, _hint, dictionary.name,
+                                           session.rows())
+        if guess < 0:
+            return { "ok": True, "word": None }
+        return { "ok": True, "word": dictionary.allowed.word(guess) }
+
+    async def hint_boards(self, name, game):
+        if game.is_over():
+            raise ValueError("The game is already over")
+        history = [ (guess, codes.tolist())
+                    for guess, codes in zip(game.guesses, game.feedback) ]
+        loop = asyncio.get_running_loop()
+        guess = await loop.run_in_executor(self._pool, _boards_hint, name,
+                                           game.n_boards, history)
+        if guess < 0:
+            return { "ok": True, "word": None }
+        return { "ok": True, "word": game.lexicon.word(guess) }
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, hint_workers=None,
+                log_dir=None, seed=0):
+    server = WordleServer(hint_workers=hint_workers, log_dir=log_dir, seed=seed)
+    listener = await server.start(host, port)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Wordle games over TCP")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--hint-workers", type=int, default=None)
+    parser.add_argument("--log-dir", default=None,
+                        help="directory for replay logs and statistics "
+                             "(default: the data directory)")
+    parser.add_argument("--seed", default="0",
+                        help="seed shared by every server for numbered puzzles")
+    parser.add_argument("--dictionary", action="append", default=[ ],
+                        metavar="NAME=ALLOWED[,ANSWERS]",
+                        help="register a dictionary from word files")
+    args = parser.parse_args()
+    for spec in args.dictionary:
+        name, _, files = spec.partition("=")
+        allowed, _, answers = files.partition(",")
+        REGISTRY.register(name, allowed, answers or None)
+    asyncio.run(serve(args.host, args.port, args.hint_workers, args.log_dir,
+                      args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# File: WordleSessions.py
+
+"""
+This module stores the state of many Wordle games compactly.  Rather
+than keeping one Python object per game, the SessionStore keeps each
+field in a typed array, with one slot per game, and recycles the
+slots of finished games.  A GameState is a small view onto one slot.
+
+With six rows of five-letter words, a game takes 53 bytes: a 16-bit
+answer id, a 16-bit dictionary index, an 8-bit row counter, six
+16-bit guess ids, six 8-bit feedback codes, 26 8-bit keyboard states
+and a 32-bit generation number that detects stale session ids.
+Stores for longer words use 16-bit feedback codes.
+"""
+
+from array import array
+
+from WordleEngine import DEFAULT_ROWS, KEY_UNKNOWN, KeyboardState, feedback_typecode
+from WordleLexicon import N_LETTERS
+
+# Constants
+
+INITIAL_CAPACITY = 1024         # Slots allocated when the store is created
+SLOT_BITS = 32                  # Low bits of a session id hold the slot
+SLOT_MASK = (1 << SLOT_BITS) - 1
+
+class GameState:
+    """
+    This class is a view onto one game in a SessionStore.  Views hold
+    no game data of their own and are cheap to create and discard.
+    """
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store, slot):
+        self._store = store
+        self._slot = slot
+
+    @property
+    def answer(self):
+        return self._store._answers[self._slot]
+
+    @property
+    def dictionary(self):
+        """The registry index of the dictionary the game uses."""
+        return self._store._dictionaries[self._slot]
+
+    @property
+    def row(self):
+        """The number of rows played so far."""
+        return self._store._rows[self._slot]
+
+    def guess(self, i):
+        return self._store._guesses[self._slot * self._store._n_rows + i]
+
+    def code(self, i):
+        return self._store._codes[self._slot * self._store._n_rows + i]
+
+    def rows(self):
+        """Returns the list of (guess id, code) pairs played so far."""
+        store = self._store
+        base = self._slot * store._n_rows
+        n = store._rows[self._slot]
+        return list(zip(store._guesses[base:base + n], store._codes[base:base + n]))
+
+    def keyboard(self):
+        """Returns a KeyboardState that reads and writes this game's keys."""
+        return KeyboardState(self._store._keys, self._slot * N_LETTERS)
+
+    def last_code(self):
+        row = self.row
+        if row == 0:
+            return -1
+        return self.code(row - 1)
+
+    def add_row(self, guess, code):
+        store = self._store
+        row = store._rows[self._slot]
+        if row >= store._n_rows:
+            raise ValueError("The game has no rows left")
+        store._guesses[self._slot * store._n_rows + row] = guess
+        store._codes[self._slot * store._n_rows + row] = code
+        store._rows[self._slot] = row + 1
+
+
+class SessionStore:
+    """
+    This class allocates and recycles game slots.  A session id packs
+    the slot number together with the slot's generation, which is
+    incremented when the slot is allocated and again when it is
+    released, so it is odd exactly while the slot is in use.  An id
+    from a released session is therefore never mistaken for the game
+    that reuses its slot.
+    """
+
+    def __init__(self, n_rows=DEFAULT_ROWS, length=5, capacity=INITIAL_CAPACITY):
+        self._n_rows = n_rows
+        self._length = length
+        self._answers = array("H")
+        self._dictionaries = array("H")
+        self._rows = array("B")
+        self._guesses = array("H")
+        self._codes = array(feedback_typecode(length))
+        self._keys = array("b")
+        self._generations = array("I")
+        self._free = array("I")
+        self._live = 0
+        self._grow(capacity)
+
+    def __len__(self):
+        return self._live
+
+    @property
+    def n_rows(self):
+        return self._n_rows
+
+    @property
+    def length(self):
+        """The word length of the games in this store."""
+        return self._length
+
+    @property
+    def capacity(self):
+        return len(self._answers)
+
+    def bytes_per_session(self):
+        """Returns the number of array bytes used by each slot."""
+        return (self._answers.itemsize + self._dictionaries.itemsize
+                + self._rows.itemsize
+                + self._n_rows * (self._guesses.itemsize + self._codes.itemsize)
+                + N_LETTERS * self._keys.itemsize
+                + self._generations.itemsize)
+
+    def _grow(self, n):
+        start = len(self._answers)
+        self._answers.extend([ 0 ] * n)
+        self._dictionaries.extend([ 0 ] * n)
+        self._rows.frombytes(bytes(n))
+        self._guesses.extend([ 0 ] * (n * self._n_rows))
+        self._codes.frombytes(bytes(n * self._n_rows * self._codes.itemsize))
+        self._keys.extend([ KEY_UNKNOWN ] * (n * N_LETTERS))
+        self._generations.extend([ 0 ] * n)
+        self._free.extend(range(start + n - 1, start - 1, -1))
+
+    def allocate(self, answer, dictionary=0):
+        """
+        Starts a game with the given answer id and dictionary index and
+        returns its session id.
+        """
+        if len(self._free) == 0:
+            self._grow(max(len(self._answers), INITIAL_CAPACITY))
+        slot = self._free.pop()
+        self._generations[slot] = (self._generations[slot] + 1) & 0xFFFFFFFF
+        self._answers[slot] = answer
+        self._dictionaries[slot] = dictionary
+        self._rows[slot] = 0
+        KeyboardState(self._keys, slot * N_LETTERS).reset()
+        self._live += 1
+        return (self._generations[slot] << SLOT_BITS) | slot
+
+    def _slot(self, session_id):
+        slot = session_id & SLOT_MASK
+        generation = session_id >> SLOT_BITS
+        if (session_id < 0 or slot >= len(self._answers)
+                or self._generations[slot] != generation
+                or generation % 2 == 0):
+            raise ValueError(f"No session {session_id}")
+        return slot
+
+    def get(self, session_id):
+        """Returns a GameState for session_id, or raises ValueError."""
+        return GameState(self, self._slot(session_id))
+
+    def release(self, session_id):
+        """Ends a session and makes its slot available for reuse."""
+        slot = self._slot(session_id)
+        self._generations[slot] = (self._generations[slot] + 1) & 0xFFFFFFFF
+        self._free.append(slot)
+        self._live -= 1
@@ -0,0 +1,355 @@
+# File: WordleSolver.py
+
+"""
+This module implements a Wordle solver that suggests guesses from the
+feedback received so far.  The set of possible answers is narrowed in
+place after each guess, and guesses are ranked by one of several
+strategies using histograms of the feedback patterns they would
+produce over the remaining candidates.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+import WordleLexicon
+from WordleEngine import HardModeConstraints, n_patterns, solved_code
+from WordleFeedback import get_matrix
+from WordleOpenings import load_book
+
+# Constants
+
+ENTROPY = "entropy"             # Maximize expected information gain
+MINIMAX = "minimax"             # Minimize the largest remaining bucket
+EXPECTED = "expected"           # Minimize the expected remaining candidates
+STRATEGIES = (ENTROPY, MINIMAX, EXPECTED)
+
+EXACT_LIMIT = 512               # Candidate count scored exactly for all guesses
+SAMPLE_SIZE = 384               # Candidates sampled when there are more
+SHORTLIST_SIZE = 64             # Guesses rescored exactly after sampling
+CACHE_ENTRIES = 65536           # Default capacity of the decision cache
+HISTOGRAM_CELLS = 1 << 22       # Histogram bins counted in one bincount
+
+def pattern_histograms(matrix, guesses, candidates, n_patterns):
+    """
+    Returns an array of shape (len(guesses), n_patterns) in which entry
+    [i, p] counts the candidates for which guess i produces pattern p.
+    All of the histograms are computed with a single bincount.
+    """
+    block = np.asarray(matrix[np.ix_(guesses, candidates)], dtype=np.int32)
+    block += (np.arange(len(guesses), dtype=np.int32) * n_patterns)[:, None]
+    counts = np.bincount(block.ravel(), minlength=len(guesses) * n_patterns)
+    return counts.reshape(len(guesses), n_patterns)
+
+def mask_ids(mask, n):
+    """Returns the ids of the set bits of a bitset over n words, as an array."""
+    data = np.frombuffer(mask.to_bytes((n + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder="little")[:n])
+
+def guess_costs(histograms, strategy=ENTROPY):
+    """
+    Returns the cost of each guess given its pattern histogram, where a
+    lower cost is better.  For ENTROPY the cost is the negated expected
+    information in bits.  Rows may count different numbers of
+    candidates, but every row must count at least one.
+    """
+    n = histograms.sum(axis=1)
+    if strategy == ENTROPY:
+        h = histograms.astype(np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            plogp = np.where(h > 0, h * np.log2(h), 0.0)
+        return plogp.sum(axis=1) / n - np.log2(n)
+    if strategy == MINIMAX:
+        return histograms.max(axis=1).astype(np.float64)
+    if strategy == EXPECTED:
+        h = histograms.astype(np.float64)
+        return (h * h).sum(axis=1) / n
+    raise ValueError(f"Unknown strategy '{strategy}'")
+
+
+class DecisionCache:
+    """
+    This class is a bounded least-recently-used map from solver states
+    to best guesses.  A state is identified by the lexicon, the strategy
+    and a digest of the sorted candidate ids, so games that reach the
+    same candidate set by different routes share an entry.
+    """
+
+    def __init__(self, max_entries=CACHE_ENTRIES):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(lexicon, strategy, candidates, legal=None):
+        """
+        Returns the cache key for a sorted array of candidate ids.  In
+        hard mode, legal is the bitset of legal guesses, which is also
+        part of the key.
+        """
+        ids = np.ascontiguousarray(candidates, dtype=np.int32)
+        h = hashlib.blake2b(ids.tobytes(), digest_size=16)
+        if legal is not None:
+            h.update(legal.to_bytes((len(lexicon) + 7) // 8, "little"))
+            strategy += "-hard"
+        return (lexicon.content_hash, strategy, h.digest())
+
+    def get(self, key):
+        """Returns the cached guess for key, or -1 on a miss."""
+        guess = self._entries.get(key)
+        if guess is None:
+            self.misses += 1
+            return -1
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return guess
+
+    def put(self, key, guess):
+        self._entries[key] = guess
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """Returns a dict of the cache's size and counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+        }
+
+
+DECISION_CACHE = DecisionCache()
+
+class Solver:
+    """
+    This class keeps the candidate answers for one game and suggests
+    the next guess.  Any word in the lexicon may be suggested, but ties
+    are broken in favor of words that could still be the answer.
+    Best guesses are memoized in a DecisionCache, which by default is
+    shared by every solver in the process.  If answers is given, only
+    those word ids are considered possible answers.  In hard mode, only
+    guesses that meet the hard-mode constraints are suggested.
+    """
+
+    _UNLOADED = object()
+
+    def __init__(self, lexicon=None, matrix=None, strategy=ENTROPY,
+                 use_book=True, cache=DECISION_CACHE, answers=None,
+                 hard_mode=False):
+        if lexicon is None:
+            lexicon = WordleLexicon.LEXICON
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}'")
+        if matrix is None:
+            matrix = get_matrix(lexicon)
+        self._lexicon = lexicon
+        self._matrix = matrix
+        self._strategy = strategy
+        self._n_patterns = n_patterns(lexicon.length)
+        self._solved = solved_code(lexicon.length)
+        self._all_guesses = np.arange(len(lexicon))
+        if answers is None:
+            answers = self._all_guesses
+        self._answers = np.unique(np.asarray(answers, dtype=np.intp))
+        self._hard = HardModeConstraints(lexicon) if hard_mode else None
+        self._book = Solver._UNLOADED if use_book else None
+        self._cache = cache
+        self.reset()
+
+    def reset(self):
+        """Restores the full candidate set for a new game."""
+        self._candidates = self._answers
+        self._history = [ ]
+        if self._hard is not None:
+            self._hard.reset()
+
+    @property
+    def lexicon(self):
+        return self._lexicon
+
+    @property
+    def strategy(self):
+        return self._strategy
+
+    @property
+    def hard_mode(self):
+        return self._hard is not None
+
+    def legal_guesses(self):
+        """
+        Returns the ids of the guesses that may be played now.  In hard
+        mode they come straight from the constraint bitset.
+        """
+        if self._hard is None:
+            return self._all_guesses
+        return mask_ids(self._hard.legal, len(self._lexicon))
+
+    @property
+    def answers(self):
+        """The ids of the words that may be answers at the start of a game."""
+        return self._answers
+
+    @property
+    def matrix(self):
+        return self._matrix
+
+    @property
+    def n_patterns(self):
+        return self._n_patterns
+
+    @property
+    def solved_code(self):
+        return self._solved
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def candidates(self):
+        """The ids of the words that are still possible answers."""
+        return self._candidates
+
+    @property
+    def history(self):
+        """The list of (guess id, feedback code) pairs seen so far."""
+        return list(self._history)
+
+    def candidate_words(self):
+        return [ self._lexicon.word(k) for k in self._candidates ]
+
+    def update(self, guess, code):
+        """
+        Narrows the candidates using the feedback code for guess, which
+        may be a word or a word id.  Only the current candidates are
+        examined, so the work shrinks as the game goes on.
+        """
+        if isinstance(guess, str):
+            guess = self._lexicon.index(guess.lower())
+            if guess < 0:
+                raise ValueError("The guess is not in the lexicon")
+        row = self._matrix[guess]
+        self._candidates = self._candidates[row[self._candidates] == code]
+        self._history.append((int(guess), int(code)))
+        if self._hard is not None:
+            self._hard.update(self._lexicon.word(guess), code)
+
+    def _costs(self, guesses, candidates):
+        """
+        Returns the cost of every guess over the candidates.  Guesses are
+        taken in blocks small enough that the histograms stay within
+        HISTOGRAM_CELLS bins, which matters for long words, where there
+        are thousands of patterns.
+        """
+        block = max(1, HISTOGRAM_CELLS // self._n_patterns)
+        costs = np.empty(len(guesses))
+        for start in range(0, len(guesses), block):
+            hist = pattern_histograms(self._matrix, guesses[start:start + block],
+                                      candidates, self._n_patterns)
+            costs[start:start + block] = guess_costs(hist, self._strategy)
+        return costs
+
+    def rank(self, limit=10, exact=False):
+        """
+        Returns a list of up to limit (guess id, cost) pairs, best first.
+        When there are many candidates and exact is False, every guess is
+        first scored against an evenly spaced sample of them, and only
+        the best SHORTLIST_SIZE guesses are scored against the full set.
+        """
+        candidates = self._candidates
+        if len(candidates) == 0:
+            return [ ]
+        if len(candidates) <= 2:
+            return [ (int(k), 0.0) for k in candidates[:limit] ]
+        guesses = self.legal_guesses()
+        if not exact and len(candidates) > EXACT_LIMIT:
+            step = len(candidates) / SAMPLE_SIZE
+            sample = candidates[(np.arange(SAMPLE_SIZE) * step).astype(np.intp)]
+            costs = self._costs(guesses, sample)
+            keep = max(SHORTLIST_SIZE, limit)
+            if len(guesses) > keep:
+                guesses = guesses[np.sort(np.argpartition(costs, keep)[:keep])]
+        costs = self._costs(guesses, candidates)
+        is_candidate = np.isin(guesses, candidates)
+        order = np.lexsort((guesses, ~is_candidate, np.round(costs, 9)))
+        return [ (int(guesses[i]), float(costs[i])) for i in order[:limit] ]
+
+    def book_guess(self):
+        """
+        Returns the opening book's guess for the current position, or -1
+        if the book does not cover it.  The book is loaded on first use.
+        """
+        if self._book is Solver._UNLOADED:
+            self._book = load_book(self._lexicon, self._strategy,
+                                   answers=self._answers)
+        book = self._book
+        if book is None or len(self._history) > 1:
+            return -1
+        if len(self._history) == 0:
+            return book.opener
+        guess, code = self._history[0]
+        if guess != book.opener:
+            return -1
+        guess = book.followup(code)
+        if guess >= 0 and self._hard is not None and not (self._hard.legal >> guess) & 1:
+            return -1
+        return guess
+
+    def best_guess(self, exact=False):
+        """Returns the id of the best next guess, or -1 if none remain."""
+        if len(self._candidates) == 0:
+            return -1
+        if not exact:
+            guess = self.book_guess()
+            if guess >= 0:
+                return guess
+        if exact or self._cache is None or len(self._candidates) <= 2:
+            return self.rank(1, exact)[0][0]
+        legal = None if self._hard is None else self._hard.legal
+        key = DecisionCache.key(self._lexicon, self._strategy, self._candidates,
+                                legal)
+        guess = self._cache.get(key)
+        if guess < 0:
+            guess = self.rank(1)[0][0]
+            self._cache.put(key, guess)
+        return guess
+
+    def best_word(self):
+        """Returns the best next guess as a word, or None if none remain."""
+        k = self.best_guess()
+        if k < 0:
+            return None
+        return self._lexicon.word(k)
+
+    def play(self, answer, max_rows=None):
+        """
+        Plays a game against the answer id using this solver and returns
+        the list of guess ids.  The solver is reset first.
+        """
+        self.reset()
+        guesses = [ ]
+        while max_rows is None or len(guesses) < max_rows:
+            guess = self.best_guess()
+            if guess < 0:
+                break
+            code = int(self._matrix[guess, answer])
+            guesses.append(guess)
+            if code == self._solved:
+                break
+            self.update(guess, code)
+        return guesses
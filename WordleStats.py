@@ -0,0 +1,198 @@
+# File: WordleStats.py
+
+"""
+This module keeps statistics about finished Wordle games: how many
+guesses the games took, the current and longest winning streaks, and
+how hard each answer has turned out to be in play.
+
+Every statistic is a running counter, so recording a game takes a
+fixed number of array updates however many games came before, and
+the figures shown after a game are read straight from the counters.
+The counters are saved to a small binary file made of a 52-byte
+header (the magic string WSTS, the format version, the number of
+rows, the content hash of the lexicon, the word count and the two
+streaks) followed by the guess distribution and two counters per
+word.  Saves are batched: the file is rewritten once every few
+hundred games and when the statistics are closed.
+"""
+
+import os
+import struct
+from array import array
+
+from WordleEngine import DEFAULT_ROWS
+from WordlePaths import data_dir
+
+# Constants
+
+STATS_VERSION = 1               # Bump when the file layout changes
+STATS_MAGIC = b"WSTS"
+HEADER = struct.Struct("<4sHBx32sIII")  # Magic, version, rows, hash, words, streaks
+SAVE_GAMES = 512                # Games recorded between saves
+
+def default_stats_path(lexicon, directory=None, owner="player"):
+    """
+    Returns the file name of the statistics that owner keeps for
+    lexicon.  Each program that records games uses its own owner name,
+    so no two of them rewrite the same file.
+    """
+    if directory is None:
+        directory = data_dir()
+    name = f"stats-v{STATS_VERSION}-{owner}-{lexicon.content_hash[:16]}.bin"
+    return os.path.join(directory, name)
+
+
+class GameStats:
+    """
+    This class counts finished games for one lexicon.  Games are
+    recorded by answer id and the number of guesses used, with 0
+    standing for a loss.  If path is given, the statistics are read
+    from it when it exists and saved to it every save_every games.  A
+    file that does not hold statistics for this game is renamed with
+    a .bad suffix and the counts start again from zero.
+    """
+
+    def __init__(self, lexicon, n_rows=DEFAULT_ROWS, path=None,
+                 save_every=SAVE_GAMES):
+        self._lexicon = lexicon
+        self._n_rows = n_rows
+        self._path = path
+        self._save_every = save_every
+        self._distribution = array("Q", [ 0 ]) * (n_rows + 1)
+        self._word_games = array("I", [ 0 ]) * len(lexicon)
+        self._word_guesses = array("I", [ 0 ]) * len(lexicon)
+        self._games = 0
+        self._streak = 0
+        self._max_streak = 0
+        self._last = None
+        self._unsaved = 0
+        if path is not None and os.path.exists(path):
+            try:
+                self._read(path)
+            except ValueError:
+                os.replace(path, path + ".bad")
+
+    @property
+    def n_rows(self):
+        return self._n_rows
+
+    @property
+    def games(self):
+        return self._games
+
+    @property
+    def wins(self):
+        return self._games - self._distribution[0]
+
+    @property
+    def streak(self):
+        """The number of games won since the last loss."""
+        return self._streak
+
+    @property
+    def max_streak(self):
+        return self._max_streak
+
+    @property
+    def last_result(self):
+        """The guesses used in the last game recorded, or None."""
+        return self._last
+
+    def win_rate(self):
+        if self._games == 0:
+            return 0.0
+        return self.wins / self._games
+
+    def share(self, n_guesses):
+        """
+        Returns the fraction of games that took n_guesses guesses, or
+        that were lost if n_guesses is 0.
+        """
+        if self._games == 0:
+            return 0.0
+        return self._distribution[n_guesses] / self._games
+
+    def distribution(self):
+        """Returns the list of game counts by guesses used, losses first."""
+        return list(self._distribution)
+
+    def word_games(self, k):
+        """Returns the number of recorded games whose answer was word k."""
+        return self._word_games[k]
+
+    def word_difficulty(self, k):
+        """
+        Returns the mean number of guesses used on answer k, counting a
+        loss as one more than the number of rows, or None if the word
+        has not been an answer.
+        """
+        n = self._word_games[k]
+        if n == 0:
+            return None
+        return self._word_guesses[k] / n
+
+    def record(self, answer, n_guesses):
+        """Adds one finished game to the counters."""
+        if n_guesses < 0 or n_guesses > self._n_rows:
+            raise ValueError(f"A game cannot take {n_guesses} guesses")
+        self._distribution[n_guesses] += 1
+        self._games += 1
+        self._word_games[answer] += 1
+        self._word_guesses[answer] += n_guesses or self._n_rows + 1
+        if n_guesses == 0:
+            self._streak = 0
+        else:
+            self._streak += 1
+            self._max_streak = max(self._max_streak, self._streak)
+        self._last = n_guesses
+        self._unsaved += 1
+        if self._path is not None and self._unsaved >= self._save_every:
+            self.save()
+
+    def _header(self):
+        return HEADER.pack(STATS_MAGIC, STATS_VERSION, self._n_rows,
+                           bytes.fromhex(self._lexicon.content_hash),
+                           len(self._lexicon), self._streak, self._max_streak)
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        n_words = len(self._lexicon)
+        size = (HEADER.size + 8 * (self._n_rows + 1) + 8 * n_words)
+        if len(data) != size:
+            raise ValueError(f"{path} is not a statistics file")
+        magic, version, n_rows, digest, words, streak, max_streak = \
+            HEADER.unpack_from(data)
+        if magic != STATS_MAGIC or version != STATS_VERSION:
+            raise ValueError(f"{path} is not a version {STATS_VERSION} statistics file")
+        if (n_rows != self._n_rows or words != n_words
+                or digest.hex() != self._lexicon.content_hash):
+            raise ValueError(f"{path} holds statistics for another game")
+        start = HEADER.size
+        for counters in (self._distribution, self._word_games, self._word_guesses):
+            end = start + len(counters) * counters.itemsize
+            counters[:] = array(counters.typecode, data[start:end])
+            start = end
+        self._games = sum(self._distribution)
+        self._streak = streak
+        self._max_streak = max_streak
+
+    def save(self, path=None):
+        """Writes the counters to path (by default, the statistics file)."""
+        if path is None:
+            path = self._path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._header())
+            f.write(self._distribution.tobytes())
+            f.write(self._word_games.tobytes())
+            f.write(self._word_guesses.tobytes())
+        os.replace(tmp, path)
+        if path == self._path:
+            self._unsaved = 0
+
+    def close(self):
+        """Saves any games recorded since the last save."""
+        if self._path is not None and self._unsaved > 0:
+            self.save()
@@ -0,0 +1,363 @@
+# File: test_wordle.py
+
+"""
+Tests for the parts of Wordle that need no display.  Each fast path
+is checked against a direct implementation of the rules.
+"""
+
+import datetime
+import math
+import random
+
+import numpy as np
+import pytest
+
+import WordleReplay
+from WordleEngine import (CORRECT, MISSING, PRESENT, CandidateTracker,
+                          HardModeConstraints, decode, encode, score)
+from WordleFeedback import (build_matrix, score_many, score_many_guesses,
+                            score_pairs)
+from WordleGraphics import KEY_YSEP, KEYBOARD_LAYOUTS, KeyboardLayout
+from WordleLexicon import Lexicon
+from WordleMultiBoard import BOARD_COUNTS, MultiBoardGame, MultiBoardSolver
+from WordleReplay import (HEADER, ReplayWriter, open_log, read_header,
+                          record_dtype)
+from WordleSchedule import EPOCH, AnswerScheduler, FeistelPermutation, puzzle_number
+from WordleSessions import INITIAL_CAPACITY, SLOT_MASK, SessionStore
+from WordleStats import GameStats
+
+LENGTHS = (4, 5, 6, 7, 8)
+
+def reference_score(guess, answer):
+    """Returns the list of letter states, computed the slow way."""
+    states = [ MISSING ] * len(guess)
+    unused = list(answer)
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            states[i] = CORRECT
+            unused[i] = None
+    for i, g in enumerate(guess):
+        if states[i] != CORRECT and g in unused:
+            states[i] = PRESENT
+            unused[unused.index(g)] = None
+    return states
+
+def random_lexicon(length, n=60, letters="abcde", seed=0):
+    """Returns a lexicon of random words over few letters, so most repeat one."""
+    rng = random.Random(seed * 100 + length)
+    words = set()
+    while len(words) < n:
+        words.add("".join(rng.choice(letters) for _ in range(length)))
+    return Lexicon(sorted(words))
+
+@pytest.mark.parametrize("guess, answer, states", [
+    ("speed", "abide", [ MISSING, MISSING, PRESENT, MISSING, PRESENT ]),
+    ("abbey", "babes", [ PRESENT, PRESENT, CORRECT, CORRECT, MISSING ]),
+    ("lllll", "hello", [ MISSING, MISSING, CORRECT, CORRECT, MISSING ]),
+    ("eerie", "there", [ PRESENT, MISSING, PRESENT, MISSING, CORRECT ]),
+    ("geese", "eerie", [ MISSING, CORRECT, PRESENT, MISSING, CORRECT ]),
+    ("crane", "crane", [ CORRECT ] * 5),
+])
+def test_score_repeated_letters(guess, answer, states):
+    assert reference_score(guess, answer) == states
+    assert decode(score(guess, answer), len(guess)) == states
+    assert score(guess, answer) == encode(states)
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_score_matches_reference(length):
+    lexicon = random_lexicon(length)
+    for guess in lexicon:
+        for answer in lexicon:
+            assert decode(score(guess, answer), length) == reference_score(guess, answer)
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_vectorized_scoring_matches_score(length):
+    lexicon = random_lexicon(length)
+    n = len(lexicon)
+    expected = np.array([ [ score(g, a) for a in lexicon ] for g in lexicon ])
+    matrix = build_matrix(lexicon)
+    assert np.array_equal(matrix, expected)
+    for k in range(n):
+        assert np.array_equal(score_many(k, None, lexicon), expected[k])
+        assert np.array_equal(score_many_guesses(None, k, lexicon), expected[:, k])
+    rng = np.random.default_rng(length)
+    g = rng.integers(0, n, 500)
+    a = rng.integers(0, n, 500)
+    assert np.array_equal(score_pairs(g, a, lexicon), expected[g, a])
+
+def consistent(lexicon, history):
+    """Returns the ids of the words that give every (guess, code) pair."""
+    return [ k for k, word in enumerate(lexicon)
+             if all(score(guess, word) == code for guess, code in history) ]
+
+def hard_mode_legal(lexicon, history):
+    """Returns the ids of the legal hard-mode guesses, the slow way."""
+    legal = [ ]
+    for k, word in enumerate(lexicon):
+        ok = True
+        for guess, code in history:
+            states = decode(code, lexicon.length)
+            for i, state in enumerate(states):
+                if state == CORRECT and word[i] != guess[i]:
+                    ok = False
+            for ch in set(guess):
+                shown = sum(1 for i, state in enumerate(states)
+                            if guess[i] == ch and state != MISSING)
+                if word.count(ch) < shown:
+                    ok = False
+        if ok:
+            legal.append(k)
+    return legal
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_candidate_tracker_matches_brute_force(length):
+    lexicon = random_lexicon(length, n=120)
+    rng = random.Random(length)
+    for _ in range(20):
+        answer = lexicon.word(rng.randrange(len(lexicon)))
+        tracker = CandidateTracker(lexicon)
+        history = [ ]
+        for _ in range(3):
+            guess = lexicon.word(rng.randrange(len(lexicon)))
+            code = score(guess, answer)
+            tracker.update(guess, code)
+            history.append((guess, code))
+            ids = consistent(lexicon, history)
+            assert lexicon.ids(tracker.candidates) == ids
+            assert tracker.count() == len(ids)
+        prefix = answer[:2]
+        for ch in prefix:
+            tracker.push(ch)
+        assert tracker.prefix_count() == sum(1 for k in ids
+                                             if lexicon.word(k).startswith(prefix))
+        tracker.pop()
+        tracker.pop()
+        assert tracker.prefix_count() == len(ids)
+
+@pytest.mark.parametrize("ch", [ "É", "è", "à", "ç", "ß", "1", "", "ab" ])
+def test_candidate_tracker_ignores_non_letters(ch):
+    lexicon = random_lexicon(5)
+    tracker = CandidateTracker(lexicon)
+    tracker.push("a")
+    tracker.push(ch)
+    assert tracker.prefix == "a"
+    tracker.push("b")
+    assert tracker.prefix == "ab"
+
+@pytest.mark.parametrize("length", LENGTHS)
+def test_hard_mode_matches_brute_force(length):
+    lexicon = random_lexicon(length, n=120)
+    rng = random.Random(length)
+    for _ in range(20):
+        answer = lexicon.word(rng.randrange(len(lexicon)))
+        constraints = HardModeConstraints(lexicon)
+        history = [ ]
+        for _ in range(3):
+            guess = lexicon.word(rng.randrange(len(lexicon)))
+            code = score(guess, answer)
+            constraints.update(guess, code)
+            history.append((guess, code))
+            legal = hard_mode_legal(lexicon, history)
+            assert constraints.ids() == legal
+            for k, word in enumerate(lexicon):
+                assert (constraints.violation(word) is None) == (k in legal)
+
+def test_multi_board_game():
+    lexicon = random_lexicon(5)
+    with pytest.raises(ValueError):
+        MultiBoardGame([ 0, 1, 2 ], lexicon)
+    answers = list(range(BOARD_COUNTS[0]))
+    game = MultiBoardGame(answers, lexicon)
+    for k in answers:
+        codes = game.submit(lexicon.word(k))
+        assert codes[k] == encode([ CORRECT ] * 5)
+    assert game.is_won() and game.is_over()
+    assert game.row == len(answers)
+
+def test_multi_board_solver_small_lexicon():
+    lexicon = random_lexicon(5)
+    answers = list(range(BOARD_COUNTS[-1]))
+    solver = MultiBoardSolver(len(answers), lexicon, build_matrix(lexicon))
+    guesses = solver.play(answers)
+    assert 0 < len(guesses)
+    assert all(0 <= g < len(lexicon) for g in guesses)
+
+def test_game_stats_round_trip_and_bad_file(tmp_path):
+    lexicon = random_lexicon(5)
+    path = str(tmp_path / "stats.bin")
+    stats = GameStats(lexicon, 6, path)
+    for answer, n_guesses in [ (3, 4), (5, 0), (3, 2), (7, 6) ]:
+        stats.record(answer, n_guesses)
+    stats.close()
+    again = GameStats(lexicon, 6, path)
+    assert again.distribution() == stats.distribution()
+    assert (again.games, again.wins, again.streak, again.max_streak) == (4, 3, 2, 2)
+    assert again.word_difficulty(3) == 3
+    with open(path, "r+b") as f:
+        f.truncate(10)
+    fresh = GameStats(lexicon, 6, path)
+    assert fresh.games == 0
+    assert (tmp_path / "stats.bin.bad").exists()
+
+@pytest.mark.parametrize("n", [ 1, 2, 3, 7, 100, 257 ])
+def test_feistel_permutation_is_bijective(n):
+    permutation = FeistelPermutation(n, b"key")
+    images = [ permutation.permute(i) for i in range(n) ]
+    assert sorted(images) == list(range(n))
+    assert [ permutation.inverse(j) for j in images ] == list(range(n))
+
+def test_answer_scheduler_is_deterministic():
+    answers = list(range(10, 60))
+    first = AnswerScheduler(answers, seed=3, tenant="en")
+    second = AnswerScheduler(answers, seed=3, tenant="en")
+    puzzles = [ 0, 1, 49, 50, 1234 ]
+    assert [ first.answer(p) for p in puzzles ] == [ second.answer(p) for p in puzzles ]
+    other = AnswerScheduler(answers, seed=4, tenant="en")
+    assert [ first.answer(p) for p in range(50) ] != [ other.answer(p) for p in range(50) ]
+
+def test_answer_scheduler_cycles_without_repeats():
+    answers = list(range(10, 60))
+    scheduler = AnswerScheduler(answers, seed=1)
+    for cycle in range(3):
+        start = cycle * len(answers)
+        played = [ scheduler.answer(p) for p in range(start, start + len(answers)) ]
+        assert sorted(played) == answers
+        for p, answer in enumerate(played, start):
+            assert scheduler.puzzle(answer, cycle) == p
+
+def test_puzzle_number_counts_days_from_epoch():
+    assert puzzle_number(EPOCH) == 0
+    assert puzzle_number(EPOCH + datetime.timedelta(days=1)) == 1
+    assert puzzle_number(EPOCH + datetime.timedelta(days=365)) == 365
+    assert puzzle_number() >= 0
+
+def test_session_store_reuses_slots():
+    store = SessionStore(capacity=4)
+    first = store.allocate(7)
+    store.release(first)
+    second = store.allocate(9)
+    assert second & SLOT_MASK == first & SLOT_MASK
+    assert second != first
+    assert store.get(second).answer == 9
+    assert len(store) == 1
+
+def test_session_store_rejects_released_ids():
+    store = SessionStore(capacity=4)
+    old = store.allocate(7)
+    store.release(old)
+    store.allocate(9)
+    with pytest.raises(ValueError):
+        store.get(old)
+    with pytest.raises(ValueError):
+        store.release(old)
+
+def test_session_store_grows():
+    store = SessionStore()
+    ids = [ store.allocate(k % 100, 1) for k in range(INITIAL_CAPACITY + 10) ]
+    assert len(set(ids)) == len(ids)
+    assert store.capacity > INITIAL_CAPACITY
+    session = store.get(ids[-1])
+    session.add_row(3, 4)
+    assert session.answer == (INITIAL_CAPACITY + 9) % 100
+    assert session.rows() == [ (3, 4) ]
+    assert store.get(ids[0]).rows() == [ ]
+
+def test_session_store_is_compact():
+    assert SessionStore().bytes_per_session() < 100
+
+def write_games(path, lexicon, games):
+    with ReplayWriter(path, lexicon, 6, flush_every=4) as log:
+        for answer, guesses in games:
+            log.append(answer, guesses,
+                       [ score(lexicon.word(g), lexicon.word(answer)) for g in guesses ])
+
+def sample_games(lexicon, n=10, seed=0):
+    rng = random.Random(seed)
+    games = [ ]
+    for _ in range(n):
+        answer = rng.randrange(len(lexicon))
+        guesses = [ rng.randrange(len(lexicon)) for _ in range(rng.randrange(1, 6)) ]
+        guesses = [ g for g in guesses if g != answer ] + [ answer ]
+        games.append((answer, guesses))
+    return games
+
+def test_replay_log_round_trip(tmp_path):
+    lexicon = random_lexicon(5)
+    path = str(tmp_path / "games.wrl")
+    games = sample_games(lexicon)
+    write_games(path, lexicon, games[:7])
+    write_games(path, lexicon, games[7:])
+    assert read_header(path) == (5, 6, lexicon.content_hash)
+    records = open_log(path)
+    assert len(records) == len(games)
+    for record, (answer, guesses) in zip(records, games):
+        n = len(guesses)
+        assert record["answer"] == answer
+        assert record["rows"] == n
+        assert list(record["guesses"][:n]) == guesses
+        assert all(record["guesses"][n:] == 0)
+
+def test_replay_writer_drops_partial_record(tmp_path):
+    lexicon = random_lexicon(5)
+    path = str(tmp_path / "games.wrl")
+    games = sample_games(lexicon, 3)
+    write_games(path, lexicon, games)
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    write_games(path, lexicon, games[:1])
+    records = open_log(path)
+    assert len(records) == 4
+    assert records[3]["answer"] == games[0][0]
+    assert list(records[3]["guesses"][:len(games[0][1])]) == games[0][1]
+
+def test_replay_flags_corrupted_feedback(tmp_path):
+    lexicon = random_lexicon(5)
+    word_path = tmp_path / "words.txt"
+    word_path.write_text("\n".join(lexicon.words) + "\n")
+    path = str(tmp_path / "games.wrl")
+    games = sample_games(lexicon)
+    write_games(path, lexicon, games)
+    WordleReplay._init_worker(str(word_path))
+    clean = WordleReplay._replay_chunk(path, 0, len(games))
+    assert clean["invalid"] == 0 and clean["mismatched_games"] == 0
+    assert sum(clean["distribution"]) == len(games)
+    records = np.memmap(path, dtype=record_dtype(5, 6), mode="r+",
+                        offset=HEADER.size, shape=(len(games),))
+    records["codes"][4, 0] ^= 1
+    records.flush()
+    del records
+    bad = WordleReplay._replay_chunk(path, 0, len(games))
+    assert bad["mismatched_games"] == 1
+    assert bad["mismatched_rows"] == 1
+    assert bad["mismatches"] == [ 4 ]
+
+def key_at(keys, x, y):
+    """Returns the label of the key at (x, y) by scanning every key."""
+    for label, kx, ky, w, h in keys:
+        if math.ceil(kx) <= int(x) <= math.floor(kx + w) and ky <= y <= ky + h:
+            return label
+    return None
+
+@pytest.mark.parametrize("layout", sorted(KEYBOARD_LAYOUTS))
+@pytest.mark.parametrize("scale", [ 1.0, 2.0 ])
+def test_keyboard_layout_find(layout, scale):
+    keyboard = KeyboardLayout(KEYBOARD_LAYOUTS[layout], scale)
+    x0, y0 = 10, 400
+    keyboard.place(x0, y0, keyboard.width + 2 * x0)
+    keys = keyboard.keys()
+    for label, x, y, w, h in keys:
+        assert keyboard.find(x + w / 2, y + h / 2) == label
+        assert keyboard.find(math.ceil(x), y) == label
+        assert keyboard.find(math.floor(x + w), y + h) == label
+        assert keyboard.find(x + w / 2, y + h + KEY_YSEP * scale / 2) is None
+    for (a, ax, ay, aw, _), (b, bx, by, _, _) in zip(keys, keys[1:]):
+        if ay == by:
+            assert keyboard.find((ax + aw + bx) / 2, ay + 1) is None
+    assert keyboard.find(x0 - 5, y0 + 1) is None
+    assert keyboard.find(x0 + 1, y0 - 1) is None
+    assert keyboard.find(x0 + 1, y0 + keyboard.height + 1) is None
+    rng = random.Random(layout)
+    for _ in range(2000):
+        x = rng.uniform(0, keyboard.width + 2 * x0)
+        y = rng.uniform(y0 - 10, y0 + keyboard.height + 10)
+        assert keyboard.find(x, y) == key_at(keys, x, y)